@@ -6,11 +6,18 @@ Use cases for fetching document assets.
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from src.domain.entities import FetchResult
-from src.domain.image_processor import DEFAULT_MAX_SIZE, process_image
+from src.domain.image_processor import (
+    DEFAULT_MAX_SIZE,
+    encode_base64,
+    process_image,
+)
 from src.domain.repositories import DocumentRepository
 from src.domain.services import AssetExtractor
 from src.domain.value_objects import AssetType
@@ -18,6 +25,41 @@ from src.domain.value_objects import AssetType
 if TYPE_CHECKING:
     pass
 
+# Stored formats vision clients accept as-is; anything else (jpx, jb2,
+# tiff, bmp, ...) is re-encoded even when the original size is requested
+_PASSTHROUGH_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "gif", "webp"})
+
+
+@dataclass(frozen=True, slots=True)
+class _EncodedFigure:
+    """Base64 payload of a processed figure and the resize note for its info."""
+
+    base64: str
+    width: int
+    height: int
+    note: str
+
+
+@lru_cache(maxsize=32)
+def _encode_image_file(path: str, mtime_ns: int, max_size: int) -> _EncodedFigure:
+    """
+    Read and process an image file for VLM consumption.
+
+    Cached per (path, mtime_ns, max_size); the mtime only serves as part of
+    the key so a rewritten image is processed again. Only the base64 text is
+    kept, not the raw or processed bytes.
+    """
+    with open(path, "rb") as f:
+        result = process_image(f.read(), max_size=max_size)
+    note = ""
+    if result.resized:
+        note = (
+            f" | Resized: {result.original_width}x{result.original_height}"
+            f" → {result.width}x{result.height}"
+            f" | {result.size_reduction_percent:.0f}% smaller"
+        )
+    return _EncodedFigure(result.base64, result.width, result.height, note)
+
 
 class AssetService:
     """
@@ -102,7 +144,7 @@ class AssetService:
 
     async def _fetch_table(self, doc_id: str, table_id: str) -> FetchResult:
         """Fetch a table by ID."""
-        manifest = self.repository.load_manifest(doc_id)
+        manifest = await asyncio.to_thread(self.repository.load_manifest, doc_id)
         if not manifest:
             return FetchResult(
                 doc_id=doc_id,
@@ -151,7 +193,7 @@ class AssetService:
             figure_id: Figure ID (e.g., "fig_1_1")
             max_size: Max longest edge in pixels (default 1024, 0=original)
         """
-        manifest = self.repository.load_manifest(doc_id)
+        manifest = await asyncio.to_thread(self.repository.load_manifest, doc_id)
         if not manifest:
             return FetchResult(
                 doc_id=doc_id,
@@ -175,25 +217,40 @@ class AssetService:
         # Load and process image
         try:
             image_path = Path(figure.path)
-            if not image_path.exists():
-                raise FileNotFoundError(f"Image not found: {figure.path}")
-
-            with open(image_path, "rb") as f:
-                original_bytes = f.read()
+            try:
+                mtime_ns = image_path.stat().st_mtime_ns
+            except OSError:
+                raise FileNotFoundError(f"Image not found: {figure.path}") from None
 
             # Use default or custom max_size
             target_size = max_size if max_size is not None else DEFAULT_MAX_SIZE
 
-            # Process image (resize + compress)
-            result = process_image(original_bytes, max_size=target_size)
-
-            # Build info text
             info = f"Page {figure.page}"
             if figure.caption:
                 info += f" | {figure.caption}"
-            if result.resized:
-                info += f" | Resized: {result.original_width}x{result.original_height} → {result.width}x{result.height}"
-                info += f" | {result.size_reduction_percent:.0f}% smaller"
+
+            if target_size == 0 and figure.ext.lower() in _PASSTHROUGH_EXTENSIONS:
+                # Original requested: pass the stored bytes through untouched
+                return FetchResult(
+                    doc_id=doc_id,
+                    asset_type=AssetType.FIGURE,
+                    asset_id=figure_id,
+                    success=True,
+                    image_base64=encode_base64(
+                        await asyncio.to_thread(image_path.read_bytes)
+                    ),
+                    image_media_type=figure.get_media_type().value,
+                    page=figure.page,
+                    width=figure.width,
+                    height=figure.height,
+                    text_content=info,
+                )
+
+            # Process image (resize + compress), reused across repeat fetches
+            result = await asyncio.to_thread(
+                _encode_image_file, str(image_path), mtime_ns, target_size
+            )
+            info += result.note
 
             return FetchResult(
                 doc_id=doc_id,
@@ -243,7 +300,7 @@ class AssetService:
 
     async def _fetch_section(self, doc_id: str, section_id: str) -> FetchResult:
         """Fetch a section by ID or title."""
-        manifest = self.repository.load_manifest(doc_id)
+        manifest = await asyncio.to_thread(self.repository.load_manifest, doc_id)
         if not manifest:
             return FetchResult(
                 doc_id=doc_id,
@@ -265,7 +322,7 @@ class AssetService:
             )
 
         # Load markdown and extract section content
-        markdown = self.repository.load_markdown(doc_id)
+        markdown = await asyncio.to_thread(self.repository.load_markdown, doc_id)
         if not markdown:
             return FetchResult(
                 doc_id=doc_id,
@@ -286,9 +343,72 @@ class AssetService:
             page=section.page,
         )
 
+    async def fetch_sections(
+        self, doc_id: str, section_ids: list[str]
+    ) -> list[FetchResult]:
+        """
+        Fetch several sections of one document.
+
+        The manifest and markdown are loaded once for the whole batch.
+
+        Args:
+            doc_id: Document identifier
+            section_ids: Section IDs or titles, in the order to return them
+
+        Returns:
+            One FetchResult per requested section
+        """
+
+        def failed(section_id: str, error: str) -> FetchResult:
+            return FetchResult(
+                doc_id=doc_id,
+                asset_type=AssetType.SECTION,
+                asset_id=section_id,
+                success=False,
+                error=error,
+            )
+
+        if not self.repository.document_exists(doc_id):
+            return [failed(s, f"Document not found: {doc_id}") for s in section_ids]
+
+        manifest = await asyncio.to_thread(self.repository.load_manifest, doc_id)
+        if not manifest:
+            return [failed(s, "Manifest not found") for s in section_ids]
+
+        sections = [manifest.assets.find_section(s) for s in section_ids]
+        found = [section for section in sections if section is not None]
+
+        markdown = None
+        if found:
+            markdown = await asyncio.to_thread(self.repository.load_markdown, doc_id)
+        contents = iter(
+            self.asset_extractor.extract_sections_content(markdown, found)
+            if markdown
+            else ()
+        )
+
+        results = []
+        for section_id, section in zip(section_ids, sections, strict=True):
+            if section is None:
+                results.append(failed(section_id, f"Section not found: {section_id}"))
+            elif not markdown:
+                results.append(failed(section_id, "Markdown file not found"))
+            else:
+                results.append(
+                    FetchResult(
+                        doc_id=doc_id,
+                        asset_type=AssetType.SECTION,
+                        asset_id=section_id,
+                        success=True,
+                        text_content=next(contents),
+                        page=section.page,
+                    )
+                )
+        return results
+
     async def _fetch_full_text(self, doc_id: str) -> FetchResult:
         """Fetch full document text."""
-        markdown = self.repository.load_markdown(doc_id)
+        markdown = await asyncio.to_thread(self.repository.load_markdown, doc_id)
         if not markdown:
             return FetchResult(
                 doc_id=doc_id,
@@ -6,6 +6,7 @@ Use cases for document ingestion and management.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -63,6 +64,12 @@ class DocumentService:
         self.knowledge_graph = knowledge_graph
         self.manifest_generator = ManifestGenerator()
 
+        # Bumped on every successful ingest so callers can cache views
+        self.version = 0
+
+        # doc_id -> in-flight manifest load shared by concurrent callers
+        self._manifest_loads: dict[str, asyncio.Future[DocumentManifest | None]] = {}
+
     async def ingest(self, file_paths: list[str]) -> list[IngestResult]:
         """
         Ingest multiple PDF files.
@@ -150,6 +157,7 @@ class DocumentService:
 
             # Step 7: Save manifest
             self.repository.save_manifest(manifest)
+            self.version += 1
 
             processing_time = time.time() - start_time
 
@@ -266,7 +274,32 @@ class DocumentService:
 
     async def get_manifest(self, doc_id: str) -> DocumentManifest | None:
         """Get manifest for a specific document."""
-        return self.repository.load_manifest(doc_id)
+        load = self._manifest_loads.get(doc_id)
+        if load is None:
+            # Cold loads read and parse JSON; keep that off the event loop
+            load = asyncio.ensure_future(
+                asyncio.to_thread(self.repository.load_manifest, doc_id)
+            )
+            self._manifest_loads[doc_id] = load
+            load.add_done_callback(lambda _: self._manifest_loads.pop(doc_id, None))
+        # Shield so one cancelled caller does not cancel the load for the rest
+        return await asyncio.shield(load)
+
+    async def load_rendered(self, doc_id: str, view: str) -> str | None:
+        """Get a stored Markdown rendering of a document view."""
+        return await asyncio.to_thread(self.repository.load_rendered, doc_id, view)
+
+    def save_rendered(self, doc_id: str, view: str, content: str, version: int) -> None:
+        """
+        Store a Markdown rendering of a document view for later reads.
+
+        Skipped when documents were ingested since ``version`` (the value
+        read before rendering). Runs on the caller's thread on purpose: with
+        no await between the check and the write, an ingest cannot save a
+        new manifest (clearing stored renderings) in between.
+        """
+        if self.version == version:
+            self.repository.save_rendered(doc_id, view, content)
 
     async def document_exists(self, doc_id: str) -> bool:
         """Check if a document exists."""
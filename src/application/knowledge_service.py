@@ -6,7 +6,9 @@ Use cases for knowledge graph queries.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 from src.domain.repositories import KnowledgeGraphInterface
 
@@ -22,8 +24,16 @@ class KnowledgeService:
     - Cross-document queries
     - Entity extraction
     - Hybrid search (local + global)
+
+    Successful query results and graph exports are kept in small LRU caches
+    with a TTL so repeated questions within an agent session skip the LLM
+    round-trip and repeated summary views skip re-parsing the graph.
     """
 
+    CACHE_SIZE = 256
+    EXPORT_CACHE_SIZE = 16
+    CACHE_TTL_SECONDS = 300.0
+
     def __init__(self, knowledge_graph: KnowledgeGraphInterface | None = None):
         """
         Initialize knowledge service.
@@ -32,6 +42,35 @@ class KnowledgeService:
             knowledge_graph: Knowledge graph implementation
         """
         self.knowledge_graph = knowledge_graph
+        self._cache: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+        self._export_cache: OrderedDict[
+            tuple[str, int], tuple[float, dict[str, object]]
+        ] = OrderedDict()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached query results and exports (call after the graph changes)."""
+        self._cache.clear()
+        self._export_cache.clear()
+
+    def _cache_get(self, cache: OrderedDict[Any, tuple[float, Any]], key: Any) -> Any:
+        """Return a fresh cached value (refreshing its LRU position) or None."""
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self.CACHE_TTL_SECONDS:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return cached[1]
+
+    @staticmethod
+    def _cache_put(
+        cache: OrderedDict[Any, tuple[float, Any]], key: Any, value: Any, size: int
+    ) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        cache[key] = (time.monotonic(), value)
+        if len(cache) > size:
+            cache.popitem(last=False)
 
     @property
     def is_available(self) -> bool:
@@ -54,12 +93,51 @@ class KnowledgeService:
                 "Knowledge graph is not available. Please enable LightRAG in settings."
             )
 
+        # Whitespace variations share an entry; case is kept ("ALL" vs "all")
+        key = (mode, " ".join(query.split()))
+        cached: str | None = self._cache_get(self._cache, key)
+        if cached is not None:
+            return cached
+
         try:
             result = await self.knowledge_graph.query(query, mode=mode)
-            return result or "No results found."
         except Exception as e:
             return f"Query failed: {e}"
 
+        if not result:
+            return "No results found."
+
+        self._cache_put(self._cache, key, result, self.CACHE_SIZE)
+        return result
+
+    async def export_graph(
+        self, format: str = "summary", limit: int = 50
+    ) -> dict[str, object]:
+        """
+        Export the knowledge graph (cached per format and limit).
+
+        Args:
+            format: Output format - "summary", "json", or "mermaid"
+            limit: Maximum number of nodes to include
+
+        Returns:
+            Dict with graph data in requested format
+        """
+        if self.knowledge_graph is None:
+            return {"format": format, "error": "Knowledge graph is not available."}
+
+        key = (format, limit)
+        cached: dict[str, object] | None = self._cache_get(self._export_cache, key)
+        if cached is not None:
+            return cached
+
+        result = await self.knowledge_graph.export_graph(format=format, limit=limit)
+
+        # Errors (e.g. graph not built yet) may resolve on the next ingest
+        if "error" not in result:
+            self._cache_put(self._export_cache, key, result, self.EXPORT_CACHE_SIZE)
+        return result
+
     async def compare_documents(self, question: str) -> str:
         """
         Compare information across documents.
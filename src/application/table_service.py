@@ -4,19 +4,80 @@ Application Layer - Table Service
 Orchestrates table creation, data accumulation, and rendering.
 """
 
-import json
+import asyncio
+import os
 import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
 from datetime import datetime
+from itertools import islice
+from pathlib import Path
 from typing import Any, Literal
 
 from src.domain.table_entities import ColumnDef, TableContext, TableDraft
+from src.domain.tokens import estimate_text_tokens
 from src.infrastructure.config import settings
 from src.infrastructure.excel_renderer import ExcelRenderer
+from src.infrastructure.serialization import dumps_line, dumps_pretty, loads
+
+
+def _write_json(path: Path, content: str) -> None:
+    """Replace a JSON state file atomically, so a crash never leaves it torn."""
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _page(items: Iterable[Any], limit: int | None, offset: int) -> Iterator[Any]:
+    """Slice one page out of ``items``, rejecting negative bounds."""
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("limit and offset must be >= 0")
+    return islice(items, offset, None if limit is None else offset + limit)
+
+
+def _write_rows(path: Path, rows: list[dict[str, Any]], append: bool = True) -> None:
+    """Append rows to a JSON Lines file, or atomically replace its contents."""
+    if append:
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(dumps_line(row) + "\n" for row in rows)
+        return
+    tmp_path = path.with_suffix(".jsonl.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(dumps_line(row) + "\n" for row in rows)
+    os.replace(tmp_path, path)
+
+
+def _read_rows(path: Path) -> list[dict[str, Any]] | None:
+    """
+    Read a JSON Lines rows file; None if there is none.
+
+    A line torn by a crash is dropped from the file too, so the next append
+    starts on a fresh line instead of being glued onto the fragment.
+    """
+    if not path.exists():
+        return None
+    rows = []
+    clean = True
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                rows.append(loads(line))
+            except ValueError:
+                clean = False
+                continue
+            if not line.endswith(b"\n"):
+                clean = False
+    if not clean:
+        _write_rows(path, rows, append=False)
+    return rows
 
 
 class TableService:
     """Service for managing A2T (Anything to Table) workflows with persistence."""
 
+    # Seconds to coalesce draft updates into one write while a loop is running
+    DRAFT_FLUSH_DELAY = 0.2
+
     def __init__(self) -> None:
         self.storage_dir = settings.table_output_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -25,6 +86,14 @@ class TableService:
         # In-memory cache
         self._tables: dict[str, TableContext] = {}
         self._drafts: dict[str, TableDraft] = {}
+        # table_id -> rendered markdown lines for the leading rows
+        self._row_lines: dict[str, list[str]] = {}
+        # table_id -> status JSON, dropped whenever the table is saved
+        self._status_json: dict[str, str] = {}
+        self._dirty_drafts: set[str] = set()
+        # Pending flush timer and the loop it was scheduled on
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
         self._excel_renderer = ExcelRenderer(self.storage_dir)
         self._load_existing_tables()
         self._load_existing_drafts()
@@ -33,26 +102,54 @@ class TableService:
         """Load table metadata from disk on startup."""
         for json_file in self.storage_dir.glob("*.json"):
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(json_file, "rb") as f:
+                    data = loads(f.read())
                     # Reconstruct TableContext
                     col_defs = [ColumnDef(**c) for c in data["columns"]]
+                    rows = _read_rows(self._rows_path(data["id"]))
                     context = TableContext(
                         id=data["id"],
                         intent=data["intent"],
                         title=data["title"],
                         columns=col_defs,
-                        rows=data["rows"],
+                        rows=data.get("rows", []) if rows is None else rows,
                         source_description=data.get("source_description", ""),
                         created_at=data.get("created_at", ""),
                     )
                     self._tables[context.id] = context
+                    if rows is None:
+                        # Older tables kept rows inline; move them out
+                        self._save_table(context)
             except Exception:
                 continue
 
-    def _save_table(self, context: TableContext) -> None:
-        """Persist table state to JSON and Markdown."""
-        # Save JSON state
+    def _rows_path(self, table_id: str) -> Path:
+        """Path of a table's rows file (JSON Lines, one row per line)."""
+        return self.storage_dir / f"{table_id}.rows.jsonl"
+
+    def _save_table(
+        self, context: TableContext, appended: list[dict[str, Any]] | None = None
+    ) -> None:
+        """
+        Persist table state to JSON and Markdown.
+
+        Rows live in their own JSON Lines file. When only ``appended`` rows
+        are new, they are added to the end of it and the metadata is left
+        alone; otherwise metadata and rows are rewritten.
+        """
+        self._status_json.pop(context.id, None)
+        if appended is not None:
+            _write_rows(self._rows_path(context.id), appended)
+        else:
+            self._save_table_state(context)
+
+        # Save Markdown preview
+        md_path = self.storage_dir / f"{context.id}.md"
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(self.preview_table(context.id, limit=1000))
+
+    def _save_table_state(self, context: TableContext) -> None:
+        """Rewrite a table's metadata JSON and its rows file."""
         json_path = self.storage_dir / f"{context.id}.json"
         state = {
             "id": context.id,
@@ -67,19 +164,14 @@ class TableService:
                 }
                 for c in context.columns
             ],
-            "rows": context.rows,
             "source_description": context.source_description,
             "created_at": str(context.created_at)
             if isinstance(context.created_at, datetime)
             else context.created_at,
         }
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
-
-        # Save Markdown preview
-        md_path = self.storage_dir / f"{context.id}.md"
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(self.preview_table(context.id, limit=1000))
+        # Rows first: if we crash in between, legacy inline rows still load
+        _write_rows(self._rows_path(context.id), context.rows, append=False)
+        _write_json(json_path, dumps_pretty(state))
 
     def create_table(
         self,
@@ -119,19 +211,21 @@ class TableService:
             raise ValueError(f"Table not found: {table_id}")
 
         context = self._tables[table_id]
-        added_count = 0
+        added = []
         errors = []
 
-        for i, row in enumerate(rows):
-            row_errors = context.validate_row(row)
+        for i, (row, row_errors) in enumerate(
+            zip(rows, context.validate_rows(rows), strict=True)
+        ):
             if row_errors:
                 errors.append({"row_index": i, "errors": row_errors})
             else:
-                context.rows.append(row)
-                added_count += 1
+                added.append(row)
+        added_count = len(added)
 
-        if added_count > 0:
-            self._save_table(context)
+        if added:
+            context.rows.extend(added)
+            self._save_table(context, appended=added)
 
         return {
             "success": added_count > 0,
@@ -156,6 +250,7 @@ class TableService:
             return {"success": False, "errors": row_errors}
 
         context.rows[index] = row
+        self._row_lines.pop(table_id, None)
         self._save_table(context)
         return {"success": True}
 
@@ -169,6 +264,7 @@ class TableService:
             raise ValueError(f"Invalid row index: {index}")
 
         context.rows.pop(index)
+        self._row_lines.pop(table_id, None)
         self._save_table(context)
         return {"success": True, "total_rows": context.row_count}
 
@@ -176,16 +272,26 @@ class TableService:
         """Delete a table and its files."""
         if table_id in self._tables:
             del self._tables[table_id]
+            self._row_lines.pop(table_id, None)
+            self._status_json.pop(table_id, None)
             # Delete files
-            for ext in [".json", ".md", ".xlsx"]:
+            for ext in [".json", ".rows.jsonl", ".md", ".xlsx"]:
                 path = self.storage_dir / f"{table_id}{ext}"
                 if path.exists():
                     path.unlink()
             return True
         return False
 
-    def list_tables(self) -> list[dict[str, Any]]:
-        """List all available tables."""
+    @property
+    def table_count(self) -> int:
+        """Number of tables currently held."""
+        return len(self._tables)
+
+    def list_tables(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[dict[str, Any]]:
+        """List available tables, optionally one page at a time."""
+        page = _page(self._tables.values(), limit, offset)
         return [
             {
                 "id": t.id,
@@ -194,7 +300,7 @@ class TableService:
                 "rows": t.row_count,
                 "created_at": str(t.created_at),
             }
-            for t in self._tables.values()
+            for t in page
         ]
 
     def update_cell(
@@ -216,6 +322,7 @@ class TableService:
         # Update the cell
         old_value = context.rows[row_index].get(column_name)
         context.rows[row_index][column_name] = value
+        self._row_lines.pop(table_id, None)
         self._save_table(context)
 
         return {
@@ -246,6 +353,14 @@ class TableService:
             "last_rows": context.rows[-2:] if context.rows else [],
         }
 
+    def get_table_status_json(self, table_id: str) -> str:
+        """Get the table status as indented JSON, reused until the table changes."""
+        status_json = self._status_json.get(table_id)
+        if status_json is None:
+            status_json = dumps_pretty(self.get_table_status(table_id))
+            self._status_json[table_id] = status_json
+        return status_json
+
     def preview_table(self, table_id: str, limit: int = 10) -> str:
         """Generate a Markdown preview of the table."""
         if table_id not in self._tables:
@@ -260,14 +375,17 @@ class TableService:
         header_line = "| " + " | ".join(headers) + " |"
         sep_line = "| " + " | ".join(["---"] * len(headers)) + " |"
 
-        # Rows
-        row_lines = []
-        for row in context.rows[:limit]:
+        # Rows: rendered once and reused; appends only render the new tail
+        row_lines = self._row_lines.setdefault(table_id, [])
+        if len(row_lines) > context.row_count:
+            row_lines.clear()
+        shown = max(0, min(limit, context.row_count))
+        for row in context.rows[len(row_lines) : shown]:
             vals = [str(row.get(h, "-")) for h in headers]
             row_lines.append("| " + " | ".join(vals) + " |")
 
         preview = f"### {context.title}\n\n{header_line}\n{sep_line}\n" + "\n".join(
-            row_lines
+            row_lines[:shown]
         )
 
         if context.row_count > limit:
@@ -296,7 +414,11 @@ class TableService:
             raise ValueError("Cannot render an empty table. Add rows first.")
 
         if format == "excel":
-            file_path = self._excel_renderer.render(context, filename)
+            # Render from a row snapshot so edits made meanwhile can't race it
+            snapshot = replace(context, rows=list(context.rows))
+            file_path = await asyncio.to_thread(
+                self._excel_renderer.render, snapshot, filename
+            )
             return {
                 "success": True,
                 "format": "excel",
@@ -318,12 +440,16 @@ class TableService:
     # Draft Management (for token-efficient workflows)
     # =========================================================================
 
+    def _pending_path(self, draft_id: str) -> Path:
+        """Path of a draft's append-only pending rows file (JSON Lines)."""
+        return self.draft_dir / f"{draft_id}.pending.jsonl"
+
     def _load_existing_drafts(self) -> None:
         """Load drafts from disk on startup."""
         for json_file in self.draft_dir.glob("draft_*.json"):
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(json_file, "rb") as f:
+                    data = loads(f.read())
                     draft = TableDraft(
                         table_id=data.get("table_id"),
                         intent=data.get("intent"),
@@ -332,16 +458,21 @@ class TableService:
                         extraction_plan=data.get("extraction_plan", []),
                         source_doc_ids=data.get("source_doc_ids", []),
                         source_sections=data.get("source_sections", []),
-                        pending_rows=data.get("pending_rows", []),
                         notes=data.get("notes", ""),
                     )
                     draft_id = json_file.stem  # draft_xxx
+                    pending = _read_rows(self._pending_path(draft_id))
+                    if pending is None:
+                        # Older drafts kept pending rows inline; move them out
+                        pending = data.get("pending_rows", [])
+                        _write_rows(self._pending_path(draft_id), pending, append=False)
+                    draft.pending_rows = pending
                     self._drafts[draft_id] = draft
             except Exception:
                 continue
 
     def _save_draft(self, draft_id: str, draft: TableDraft) -> None:
-        """Persist draft to disk."""
+        """Persist draft metadata to disk (pending rows live in their own file)."""
         json_path = self.draft_dir / f"{draft_id}.json"
         state = {
             "table_id": draft.table_id,
@@ -351,12 +482,39 @@ class TableService:
             "extraction_plan": draft.extraction_plan,
             "source_doc_ids": draft.source_doc_ids,
             "source_sections": draft.source_sections,
-            "pending_rows": draft.pending_rows,
             "notes": draft.notes,
             "last_updated": str(draft.last_updated),
         }
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        _write_json(json_path, dumps_pretty(state))
+
+    def _mark_draft_dirty(self, draft_id: str) -> None:
+        """Schedule a draft write, coalescing bursts of updates."""
+        self._dirty_drafts.add(draft_id)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to defer on (e.g. sync callers): write through
+            self.flush_drafts()
+            return
+        if self._flush_handle is None or self._flush_loop is not loop:
+            # A timer left on a previous (closed) loop would never fire
+            self._flush_handle = loop.call_later(
+                self.DRAFT_FLUSH_DELAY, self.flush_drafts
+            )
+            self._flush_loop = loop
+
+    def flush_drafts(self) -> int:
+        """Write all drafts with unsaved updates. Returns the number written."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        dirty, self._dirty_drafts = self._dirty_drafts, set()
+        for draft_id in dirty:
+            draft = self._drafts.get(draft_id)
+            if draft is not None:
+                self._save_draft(draft_id, draft)
+        return len(dirty)
 
     def create_draft(
         self,
@@ -411,19 +569,48 @@ class TableService:
             if key in allowed_fields:
                 setattr(draft, key, value)
 
+        if "pending_rows" in updates:
+            _write_rows(self._pending_path(draft_id), draft.pending_rows, append=False)
+
         draft.last_updated = datetime.now()
-        self._save_draft(draft_id, draft)
+        self._mark_draft_dirty(draft_id)
 
         return {"success": True, "draft_id": draft_id}
 
+    def add_pending_rows(self, draft_id: str, rows: list[dict[str, Any]]) -> int:
+        """
+        Append rows to a draft's pending rows.
+
+        Only the new rows are written (appended to the pending rows file).
+        Returns the new pending row total.
+        """
+        if draft_id not in self._drafts:
+            raise ValueError(f"Draft not found: {draft_id}")
+
+        draft = self._drafts[draft_id]
+        draft.pending_rows.extend(rows)
+        _write_rows(self._pending_path(draft_id), rows)
+
+        draft.last_updated = datetime.now()
+        self._mark_draft_dirty(draft_id)
+        return len(draft.pending_rows)
+
     def get_draft(self, draft_id: str) -> TableDraft:
         """Get a draft by ID."""
         if draft_id not in self._drafts:
             raise ValueError(f"Draft not found: {draft_id}")
         return self._drafts[draft_id]
 
-    def list_drafts(self) -> list[dict[str, Any]]:
-        """List all drafts."""
+    @property
+    def draft_count(self) -> int:
+        """Number of drafts currently held."""
+        return len(self._drafts)
+
+    def list_drafts(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[dict[str, Any]]:
+        """List drafts, optionally one page at a time."""
+        page = _page(self._drafts.items(), limit, offset)
         return [
             {
                 "id": draft_id,
@@ -434,16 +621,20 @@ class TableService:
                 "pending_rows": len(d.pending_rows),
                 "last_updated": str(d.last_updated),
             }
-            for draft_id, d in self._drafts.items()
+            for draft_id, d in page
         ]
 
     def delete_draft(self, draft_id: str) -> bool:
         """Delete a draft."""
         if draft_id in self._drafts:
             del self._drafts[draft_id]
-            json_path = self.draft_dir / f"{draft_id}.json"
-            if json_path.exists():
-                json_path.unlink()
+            self._dirty_drafts.discard(draft_id)
+            for path in (
+                self.draft_dir / f"{draft_id}.json",
+                self._pending_path(draft_id),
+            ):
+                if path.exists():
+                    path.unlink()
             return True
         return False
 
@@ -475,7 +666,8 @@ class TableService:
 
         # Update draft with table_id
         draft.table_id = table_id
-        self._save_draft(draft_id, draft)
+        self._dirty_drafts.add(draft_id)
+        self.flush_drafts()
 
         return table_id
 
@@ -492,13 +684,18 @@ class TableService:
         content_tokens = context.estimate_tokens()
 
         # Estimate preview tokens
-        preview = self.preview_table(table_id, limit=10)
-        preview_tokens = len(preview) // 4
+        preview_tokens = estimate_text_tokens(self.preview_table(table_id, limit=10))
+        if context.row_count <= 10:
+            # The 10-row preview already is the full preview
+            full_preview_tokens = preview_tokens
+        else:
+            full_preview = self.preview_table(table_id, limit=1000)
+            full_preview_tokens = estimate_text_tokens(full_preview)
 
         return {
             "content_tokens": content_tokens,
             "preview_tokens": preview_tokens,
-            "full_preview_tokens": len(self.preview_table(table_id, limit=1000)) // 4,
+            "full_preview_tokens": full_preview_tokens,
             "row_count": context.row_count,
             "tokens_per_row": content_tokens // max(context.row_count, 1),
         }
@@ -23,6 +23,7 @@ from .entities import (
     TableAsset,
 )
 from .job import Job, JobProgress, JobStatus, JobSummary, JobType
+from .tokens import estimate_text_tokens
 from .value_objects import AssetType, DocId, ImageMediaType
 
 __all__ = [
@@ -52,6 +53,8 @@ __all__ = [
     "JobStatus",
     "JobSummary",
     "JobType",
+    # Tokens
+    "estimate_text_tokens",
     # Value Objects
     "AssetType",
     "DocId",
@@ -66,7 +66,7 @@ class ChunkConfig:
         return configs.get(doc_type, cls())
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """
     A document chunk with metadata.
@@ -107,6 +107,9 @@ class BasicChunker(ChunkingStrategy):
     Simple but effective for most use cases.
     """
 
+    # Characters that end a sentence (Latin and CJK punctuation)
+    SENTENCE_ENDINGS = ".。!?！？"
+
     def chunk(self, text: str, config: ChunkConfig) -> list[Chunk]:
         """Split text into overlapping chunks."""
         chunks: list[Chunk] = []
@@ -161,19 +164,14 @@ class BasicChunker(ChunkingStrategy):
         """Adjust chunk to end at sentence boundary if possible."""
         # Look for sentence endings in the last 20% of chunk
         search_start = int(len(chunk_text) * 0.8)
-        search_region = chunk_text[search_start:]
-
-        # Find last sentence ending
-        sentence_endings = [".。!?！？", "\n\n"]
-        best_pos = -1
 
-        for ending in sentence_endings[0]:
-            pos = search_region.rfind(ending)
-            if pos > best_pos:
-                best_pos = pos
+        # Find last sentence ending (rfind scans in place, no region copy)
+        best_pos = max(
+            chunk_text.rfind(ending, search_start) for ending in self.SENTENCE_ENDINGS
+        )
 
         if best_pos >= 0:
-            return chunk_text[: search_start + best_pos + 1]
+            return chunk_text[: best_pos + 1]
 
         return chunk_text
 
@@ -410,6 +408,57 @@ class PageAwareChunker(ChunkingStrategy):
 # ============================================================================
 
 
+# Content keywords per document type, checked in this order; a type wins
+# when at least _TERM_THRESHOLD of its keywords appear in the text sample
+_TYPE_TERMS: tuple[tuple[DocumentType, tuple[str, ...]], ...] = (
+    (
+        DocumentType.MEDICAL,
+        (
+            "patient",
+            "diagnosis",
+            "treatment",
+            "clinical",
+            "drug",
+            "dose",
+            "mg",
+            "ml",
+            "syndrome",
+            "disease",
+        ),
+    ),
+    (
+        DocumentType.TECHNICAL,
+        (
+            "algorithm",
+            "implementation",
+            "function",
+            "class",
+            "method",
+            "api",
+            "code",
+            "parameter",
+            "import",
+            "def ",
+        ),
+    ),
+    (
+        DocumentType.LEGAL,
+        (
+            "hereby",
+            "whereas",
+            "agreement",
+            "party",
+            "clause",
+            "section",
+            "liability",
+            "indemnify",
+        ),
+    ),
+)
+_TERM_THRESHOLD = 3
+_SIMPLE_EXTENSIONS = (".md", ".txt", ".rst")
+
+
 def detect_document_type(text: str, filename: str = "") -> DocumentType:
     """
     Detect document type from content and filename.
@@ -421,56 +470,20 @@ def detect_document_type(text: str, filename: str = "") -> DocumentType:
     Returns:
         Detected DocumentType
     """
-    text_sample = text[:5000].lower()
+    # Check filename hints (before touching the text)
     filename_lower = filename.lower()
-
-    # Check filename hints
-    if any(ext in filename_lower for ext in [".md", ".txt", ".rst"]):
+    if any(ext in filename_lower for ext in _SIMPLE_EXTENSIONS):
         return DocumentType.SIMPLE
 
-    # Check content patterns
-    medical_terms = [
-        "patient",
-        "diagnosis",
-        "treatment",
-        "clinical",
-        "drug",
-        "dose",
-        "mg",
-        "ml",
-        "syndrome",
-        "disease",
-    ]
-    if sum(1 for term in medical_terms if term in text_sample) >= 3:
-        return DocumentType.MEDICAL
-
-    technical_terms = [
-        "algorithm",
-        "implementation",
-        "function",
-        "class",
-        "method",
-        "api",
-        "code",
-        "parameter",
-        "import",
-        "def ",
-    ]
-    if sum(1 for term in technical_terms if term in text_sample) >= 3:
-        return DocumentType.TECHNICAL
-
-    legal_terms = [
-        "hereby",
-        "whereas",
-        "agreement",
-        "party",
-        "clause",
-        "section",
-        "liability",
-        "indemnify",
-    ]
-    if sum(1 for term in legal_terms if term in text_sample) >= 3:
-        return DocumentType.LEGAL
+    # Check content patterns, stopping at the threshold
+    text_sample = text[:5000].lower()
+    for doc_type, terms in _TYPE_TERMS:
+        found = 0
+        for term in terms:
+            if term in text_sample:
+                found += 1
+                if found >= _TERM_THRESHOLD:
+                    return doc_type
 
     return DocumentType.GENERAL
 
@@ -6,13 +6,16 @@ Core business objects with identity.
 
 from __future__ import annotations
 
-import base64
+from collections.abc import Callable
 from datetime import datetime
+from itertools import islice
+from operator import is_
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from .image_processor import encode_base64
 from .value_objects import AssetType, ImageMediaType
 
 # ============================================================================
@@ -53,12 +56,11 @@ class FigureAsset(BaseModel):
 
     def to_base64(self) -> str:
         """Convert image to base64 string."""
-        img_path = Path(self.path)
-        if not img_path.exists():
-            raise FileNotFoundError(f"Image not found: {self.path}")
-
-        with open(img_path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
+        try:
+            with open(self.path, "rb") as f:
+                return encode_base64(f.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image not found: {self.path}") from None
 
     def get_media_type(self) -> ImageMediaType:
         """Get MIME type for the image."""
@@ -96,27 +98,57 @@ class DocumentAssets(BaseModel):
     figures: list[FigureAsset] = Field(default_factory=list)
     sections: list[SectionAsset] = Field(default_factory=list)
 
+    # asset kind -> (elements the index was built from, lookup key -> first match)
+    _indexes: dict[str, tuple[list[Any], dict[str, Any]]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def _index(
+        self, kind: str, assets: list[Any], keys: Callable[[Any], tuple[str, ...]]
+    ) -> dict[str, Any]:
+        """
+        Lookup table for one asset list, built on first use.
+
+        The asset lists stay mutable, so the index keeps a shallow snapshot
+        of the elements it was built from and is rebuilt whenever the list
+        no longer holds those exact objects (reassigned, appended to or an
+        element replaced in place). Editing an asset's own ``id``/``title``
+        is not detected. The first asset with a given key wins, as with a
+        linear scan.
+        """
+        cached = self._indexes.get(kind)
+        if (
+            cached is not None
+            and len(cached[0]) == len(assets)
+            and all(map(is_, cached[0], assets))
+        ):
+            return cached[1]
+        index: dict[str, Any] = {}
+        for asset in assets:
+            for key in keys(asset):
+                index.setdefault(key, asset)
+        self._indexes[kind] = (list(assets), index)
+        return index
+
     def find_table(self, table_id: str) -> TableAsset | None:
         """Find a table by ID."""
-        for table in self.tables:
-            if table.id == table_id:
-                return table
-        return None
+        index = self._index("tables", self.tables, lambda t: (t.id,))
+        table: TableAsset | None = index.get(table_id)
+        return table
 
     def find_figure(self, figure_id: str) -> FigureAsset | None:
         """Find a figure by ID."""
-        for figure in self.figures:
-            if figure.id == figure_id:
-                return figure
-        return None
+        index = self._index("figures", self.figures, lambda f: (f.id,))
+        figure: FigureAsset | None = index.get(figure_id)
+        return figure
 
     def find_section(self, section_id_or_title: str) -> SectionAsset | None:
         """Find a section by ID or title (case-insensitive)."""
-        search = section_id_or_title.lower()
-        for section in self.sections:
-            if section.id.lower() == search or section.title.lower() == search:
-                return section
-        return None
+        index = self._index(
+            "sections", self.sections, lambda s: (s.id.lower(), s.title.lower())
+        )
+        section: SectionAsset | None = index.get(section_id_or_title.lower())
+        return section
 
     def get_summary(self) -> dict[str, int]:
         """Get count of each asset type."""
@@ -169,10 +201,21 @@ class DocumentManifest(BaseModel):
     markdown_path: str = Field("", description="Path to full markdown file")
     manifest_path: str = Field("", description="Path to this manifest JSON")
 
+    # limit -> comma-joined entity preview (not serialized)
+    _entity_previews: dict[int, str] = PrivateAttr(default_factory=dict)
+
     def get_asset_summary(self) -> dict[str, int]:
         """Get count of each asset type."""
         return self.assets.get_summary()
 
+    def entity_preview(self, limit: int) -> str:
+        """Comma-joined first ``limit`` LightRAG entities, computed once per limit."""
+        preview = self._entity_previews.get(limit)
+        if preview is None:
+            preview = ", ".join(islice(self.lightrag_entities, limit))
+            self._entity_previews[limit] = preview
+        return preview
+
 
 # ============================================================================
 # Result Objects (for use case responses)
@@ -247,3 +290,18 @@ class DocumentSummary(BaseModel):
     def ingested_at(self) -> datetime:
         """Alias for created_at."""
         return self.created_at
+
+    @classmethod
+    def from_manifest(cls, manifest: DocumentManifest) -> DocumentSummary:
+        """Create summary from full manifest."""
+        asset_summary = manifest.get_asset_summary()
+        return cls(
+            doc_id=manifest.doc_id,
+            filename=manifest.filename,
+            title=manifest.title,
+            page_count=manifest.page_count,
+            table_count=asset_summary.get("tables", 0),
+            figure_count=asset_summary.get("figures", 0),
+            section_count=asset_summary.get("sections", 0),
+            created_at=manifest.created_at,
+        )
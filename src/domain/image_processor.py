@@ -11,10 +11,28 @@ import base64
 import io
 from dataclasses import dataclass
 
+try:
+    # SIMD-accelerated base64 (optional, see `speedups` extra)
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:  # pragma: no cover - depends on environment
+
+    def _b64encode_as_string(s: bytes) -> str:
+        return base64.b64encode(s).decode("ascii")
+
+
 # Default max size - works well for most VLMs
 DEFAULT_MAX_SIZE = 1024
 
 
+def encode_base64(data: bytes) -> str:
+    """
+    Encode raw bytes as a base64 string.
+
+    Uses pybase64 (AVX2/SSSE3) when installed, stdlib base64 otherwise.
+    """
+    return _b64encode_as_string(data)
+
+
 @dataclass
 class ProcessedImage:
     """Result of image processing."""
@@ -112,7 +130,7 @@ def process_image(
     processed_bytes = output.getvalue()
 
     # Convert to base64
-    b64 = base64.b64encode(processed_bytes).decode("utf-8")
+    b64 = encode_base64(processed_bytes)
 
     return ProcessedImage(
         data=processed_bytes,
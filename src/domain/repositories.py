@@ -33,6 +33,16 @@ class DocumentRepository(ABC):
         """Load document manifest by ID."""
         ...
 
+    def invalidate_manifest(self, doc_id: str | None = None) -> None:  # noqa: B027
+        """Drop cached manifests, if the implementation caches them."""
+
+    def load_rendered(self, doc_id: str, view: str) -> str | None:
+        """Load a stored Markdown rendering of a document view, if any."""
+        return None
+
+    def save_rendered(self, doc_id: str, view: str, content: str) -> None:  # noqa: B027
+        """Store a Markdown rendering of a document view, if supported."""
+
     @abstractmethod
     def save_markdown(self, doc_id: str, content: str) -> Path:
         """Save markdown content and return path."""
@@ -128,3 +138,13 @@ class KnowledgeGraphInterface(ABC):
     async def extract_entities(self, text: str, limit: int = 5) -> list[str]:
         """Extract top entities from text."""
         ...
+
+    @abstractmethod
+    async def export_graph(
+        self,
+        format: str = "summary",
+        limit: int = 50,
+        entity_types: list[str] | None = None,
+    ) -> dict[str, object]:
+        """Export graph nodes/edges as summary, json, or mermaid."""
+        ...
@@ -7,6 +7,7 @@ Business logic that doesn't naturally fit within an entity.
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from typing import TYPE_CHECKING
 
 from .entities import (
@@ -20,6 +21,15 @@ from .entities import (
 if TYPE_CHECKING:
     pass
 
+# Markdown pipe table: header row, separator row, then body rows
+_TABLE_PATTERN = re.compile(r"(\|[^\n]+\|\n\|[-:\| ]+\|\n(?:\|[^\n]+\|\n?)+)")
+_PAGE_MARKER = re.compile(r"<!-- Page (\d+) -->")
+_HEADER_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+_HEADER_PREFIX = re.compile(r"^(#{1,6})\s+")
+_TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_BOLD_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+_NON_ID_CHARS = re.compile(r"[^a-z0-9]")
+
 
 class ManifestGenerator:
     """
@@ -90,11 +100,9 @@ class ManifestGenerator:
     def _parse_tables(self, markdown: str) -> list[TableAsset]:
         """Parse markdown pipe tables."""
         tables = []
+        marker_ends, marker_pages = self._page_markers(markdown)
 
-        # Regex for markdown tables
-        table_pattern = r"(\|[^\n]+\|\n\|[-:\| ]+\|\n(?:\|[^\n]+\|\n?)+)"
-
-        for match_idx, match in enumerate(re.finditer(table_pattern, markdown)):
+        for match_idx, match in enumerate(_TABLE_PATTERN.finditer(markdown)):
             table_text = match.group(1)
 
             # Count rows and columns
@@ -102,9 +110,9 @@ class ManifestGenerator:
             row_count = len(rows) - 1  # Exclude header separator
             col_count = rows[0].count("|") - 1 if rows else 0
 
-            # Find which page this table is on
-            table_start = match.start()
-            page_for_table = self._find_page_at_position(markdown, table_start)
+            # Find which page this table is on (last marker before it)
+            marker_idx = bisect_right(marker_ends, match.start())
+            page_for_table = marker_pages[marker_idx - 1] if marker_idx else 1
 
             # Preview: first 100 chars
             preview = table_text[:100].replace("\n", " ")
@@ -125,74 +133,86 @@ class ManifestGenerator:
 
     def _parse_sections(self, markdown: str) -> list[SectionAsset]:
         """Parse markdown headers as sections."""
-        sections = []
         lines = markdown.split("\n")
         current_page = 1
 
+        # (start line, level, title, page) per section, plus its end line
+        found: list[tuple[int, int, str, int]] = []
+        end_lines: list[int] = []
+        # Sections still waiting for their end line (levels strictly increase)
+        open_sections: list[int] = []
+
         for i, line in enumerate(lines):
+            if line.startswith("#"):
+                # Any header closes open sections of the same or deeper level
+                header_prefix = _HEADER_PREFIX.match(line)
+                if header_prefix:
+                    level = len(header_prefix.group(1))
+                    while open_sections and found[open_sections[-1]][1] >= level:
+                        end_lines[open_sections.pop()] = i
+
             # Update current page
-            page_match = re.search(r"<!-- Page (\d+) -->", line)
-            if page_match:
-                current_page = int(page_match.group(1))
-                continue
+            if "<!-- Page " in line:
+                page_match = _PAGE_MARKER.search(line)
+                if page_match:
+                    current_page = int(page_match.group(1))
+                    continue
 
             # Detect headers
-            header_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+            header_match = _HEADER_PATTERN.match(line) if line.startswith("#") else None
             if header_match:
                 level = len(header_match.group(1))
                 title = header_match.group(2).strip()
 
                 # Clean title (remove markdown formatting)
-                title = re.sub(r"\*\*([^*]+)\*\*", r"\1", title)
+                title = _BOLD_PATTERN.sub(r"\1", title)
                 title = title.strip()
 
                 if not title:
                     continue
 
-                # Generate section ID
-                sec_id = f"sec_{re.sub(r'[^a-z0-9]', '_', title.lower())[:30]}"
-
-                # Find section end (next header of same or higher level)
-                end_line = len(lines)
-                for j in range(i + 1, len(lines)):
-                    next_header = re.match(r"^(#{1,6})\s+", lines[j])
-                    if next_header and len(next_header.group(1)) <= level:
-                        end_line = j
-                        break
-
-                # Preview: content after header
-                content_lines = lines[i + 1 : min(i + 5, end_line)]
-                preview = " ".join(
-                    ln.strip()
-                    for ln in content_lines
-                    if ln.strip() and not ln.startswith("<!--")
-                )[:200]
-
-                sections.append(
-                    SectionAsset(
-                        id=sec_id,
-                        title=title,
-                        level=level,
-                        page=current_page,
-                        start_line=i,
-                        end_line=end_line,
-                        preview=preview,
-                    )
+                open_sections.append(len(found))
+                found.append((i, level, title, current_page))
+                end_lines.append(len(lines))
+
+        sections = []
+        for (start, level, title, page), end_line in zip(found, end_lines, strict=True):
+            # Preview: content after header
+            content_lines = lines[start + 1 : min(start + 5, end_line)]
+            preview = " ".join(
+                ln.strip()
+                for ln in content_lines
+                if ln.strip() and not ln.startswith("<!--")
+            )[:200]
+
+            sections.append(
+                SectionAsset(
+                    # Generate section ID
+                    id=f"sec_{_NON_ID_CHARS.sub('_', title.lower())[:30]}",
+                    title=title,
+                    level=level,
+                    page=page,
+                    start_line=start,
+                    end_line=end_line,
+                    preview=preview,
                 )
+            )
 
         return sections
 
-    def _find_page_at_position(self, markdown: str, position: int) -> int:
-        """Find page number at a given position in markdown."""
-        page = 1
-        for match in re.finditer(r"<!-- Page (\d+) -->", markdown[:position]):
-            page = int(match.group(1))
-        return page
+    def _page_markers(self, markdown: str) -> tuple[list[int], list[int]]:
+        """Scan page markers once: (end offsets, page numbers), in order."""
+        ends: list[int] = []
+        pages: list[int] = []
+        for match in _PAGE_MARKER.finditer(markdown):
+            ends.append(match.end())
+            pages.append(int(match.group(1)))
+        return ends, pages
 
     def _detect_title(self, markdown: str) -> str:
         """Detect document title from first heading."""
         # Try first H1 heading
-        match = re.search(r"^#\s+(.+)$", markdown, re.MULTILINE)
+        match = _TITLE_PATTERN.search(markdown)
         if match:
             return match.group(1).strip()
 
@@ -212,7 +232,8 @@ class AssetExtractor:
 
     def extract_section_content(self, markdown: str, section: SectionAsset) -> str:
         """Extract full content of a section."""
-        lines = markdown.split("\n")
+        # Lines past the section's end stay unsplit in the last element
+        lines = markdown.split("\n", max(section.end_line, 0))
 
         if section.start_line >= len(lines):
             return ""
@@ -220,12 +241,23 @@ class AssetExtractor:
         section_lines = lines[section.start_line : section.end_line]
         return "\n".join(section_lines)
 
+    def extract_sections_content(
+        self, markdown: str, sections: list[SectionAsset]
+    ) -> list[str]:
+        """Extract several sections, splitting the markdown only once."""
+        last_line = max((section.end_line for section in sections), default=0)
+        lines = markdown.split("\n", max(last_line, 0))
+        return [
+            "\n".join(lines[section.start_line : section.end_line])
+            if section.start_line < len(lines)
+            else ""
+            for section in sections
+        ]
+
     def extract_table_by_id(self, markdown: str, table_id: str) -> str | None:
         """Extract a specific table by ID."""
         # Parse tables and find matching one
-        table_pattern = r"(\|[^\n]+\|\n\|[-:\| ]+\|\n(?:\|[^\n]+\|\n?)+)"
-
-        for match_idx, match in enumerate(re.finditer(table_pattern, markdown)):
+        for match_idx, match in enumerate(_TABLE_PATTERN.finditer(markdown)):
             if f"tab_{match_idx + 1}" == table_id:
                 return match.group(1)
 
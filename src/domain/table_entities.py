@@ -4,10 +4,13 @@ Domain Layer - Table Entities
 Entities and value objects for the A2T (Anything to Table) module.
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal
 
+from .tokens import estimate_text_tokens
+
 
 @dataclass
 class ColumnDef:
@@ -37,22 +40,36 @@ class TableDraft:
     notes: str = ""  # Agent's working notes
     last_updated: datetime = field(default_factory=datetime.now)
 
+    # Running token count over pending_rows: (list counted, rows counted, tokens)
+    _pending_count: tuple[list[dict[str, Any]] | None, int, int] = field(
+        default=(None, 0, 0), init=False, repr=False, compare=False
+    )
+
+    def pending_tokens(self) -> int:
+        """Estimate tokens in pending_rows, counting only rows added since last call."""
+        rows = self.pending_rows
+        counted_rows, counted, tokens = self._pending_count
+        if rows is not counted_rows or len(rows) < counted:
+            # List replaced or truncated: start over
+            counted, tokens = 0, 0
+        if len(rows) > counted:
+            new_rows = json.dumps(rows[counted:], ensure_ascii=False)
+            tokens += estimate_text_tokens(new_rows)
+        self._pending_count = (rows, len(rows), tokens)
+        return tokens
+
     def estimate_tokens(self) -> int:
         """Estimate token count for this draft."""
-        import json
-
         content = json.dumps(
             {
                 "title": self.title,
                 "columns": self.proposed_columns,
                 "plan": self.extraction_plan,
-                "pending": self.pending_rows,
                 "notes": self.notes,
             },
             ensure_ascii=False,
         )
-        # Rough estimate: 1 token ≈ 4 characters for mixed content
-        return len(content) // 4
+        return estimate_text_tokens(content) + self.pending_tokens()
 
 
 @dataclass
@@ -103,49 +120,59 @@ class TableContext:
 
     def estimate_tokens(self) -> int:
         """Estimate token count for this table's content."""
-        import json
-
         content = json.dumps(self.rows, ensure_ascii=False)
         # Add header tokens
-        header_tokens = sum(len(c.name) for c in self.columns) // 4
-        return len(content) // 4 + header_tokens
+        header_tokens = estimate_text_tokens("".join(c.name for c in self.columns))
+        return estimate_text_tokens(content) + header_tokens
 
     def validate_row(self, row: dict[str, Any]) -> list[str]:
         """
         Validate a row against the column definitions.
         Returns a list of error messages.
         """
-        errors = []
+        return self.validate_rows([row])[0]
+
+    def validate_rows(self, rows: list[dict[str, Any]]) -> list[list[str]]:
+        """
+        Validate several rows against the column definitions.
+        Returns one list of error messages per row.
+
+        Works column by column, so each column's rule is resolved once
+        per batch instead of once per row.
+        """
         col_names = {col.name for col in self.columns}
 
         # Check for unknown columns
-        for key in row.keys():
-            if key not in col_names:
-                errors.append(f"Unknown column: '{key}'")
+        errors = [
+            [f"Unknown column: '{key}'" for key in row if key not in col_names]
+            for row in rows
+        ]
 
         # Check each column definition
         for col in self.columns:
-            val = row.get(col.name)
-
-            # Check required
-            if col.required and val is None:
-                errors.append(f"Missing required column: '{col.name}'")
-                continue
-
-            if val is None:
-                continue
-
-            # Check type
-            if col.type == "number":
-                if not isinstance(val, int | float):
-                    errors.append(
-                        f"Column '{col.name}' must be a number, got {type(val).__name__}"
-                    )
-            elif col.type == "enum":
-                if col.enum_values and val not in col.enum_values:
-                    errors.append(
-                        f"Invalid value for enum column '{col.name}': '{val}'. Allowed: {col.enum_values}"
+            name = col.name
+            is_number = col.type == "number"
+            enum_values = col.enum_values if col.type == "enum" else None
+
+            for row, row_errors in zip(rows, errors, strict=True):
+                val = row.get(name)
+
+                # Check required
+                if val is None:
+                    if col.required:
+                        row_errors.append(f"Missing required column: '{name}'")
+                    continue
+
+                # Check type
+                if is_number:
+                    if not isinstance(val, int | float):
+                        row_errors.append(
+                            f"Column '{name}' must be a number, got {type(val).__name__}"
+                        )
+                elif enum_values and val not in enum_values:
+                    row_errors.append(
+                        f"Invalid value for enum column '{name}': '{val}'. Allowed: {enum_values}"
                     )
-            # Basic URL validation could be added here if needed
+                # Basic URL validation could be added here if needed
 
         return errors
@@ -0,0 +1,18 @@
+"""
+Domain Layer - Token Estimation
+
+Rough token counts used to size sections, tables and drafts for LLM context.
+"""
+
+
+def estimate_text_tokens(text: str) -> int:
+    """
+    Estimate the token count of text.
+
+    ASCII averages ~4 characters per token, while CJK and other non-ASCII
+    characters are closer to one token each.
+    """
+    if text.isascii():
+        return len(text) // 4
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars)
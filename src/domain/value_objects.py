@@ -10,6 +10,10 @@ import re
 from enum import Enum
 from typing import Any
 
+# Must start with 'doc_' and contain only alphanumeric + underscore
+_DOC_ID_PATTERN = re.compile(r"^doc_[a-z0-9_]+$")
+_NON_ID_CHARS = re.compile(r"[^a-z0-9]")
+
 
 class AssetType(str, Enum):
     """Asset types in a document."""
@@ -40,8 +44,7 @@ class DocId:
         """Validate doc_id format."""
         if not value:
             return False
-        # Must start with 'doc_' and contain only alphanumeric + underscore
-        return bool(re.match(r"^doc_[a-z0-9_]+$", value))
+        return bool(_DOC_ID_PATTERN.match(value))
 
     @classmethod
     def generate(cls, filename: str, unique_suffix: str) -> DocId:
@@ -49,7 +52,7 @@ class DocId:
         import hashlib
 
         # Clean filename
-        name = re.sub(r"[^a-z0-9]", "_", filename.lower())[:30]
+        name = _NON_ID_CHARS.sub("_", filename.lower())[:30]
         # Add hash for uniqueness
         hash_suffix = hashlib.md5(unique_suffix.encode()).hexdigest()[:6]
         return cls(f"doc_{name}_{hash_suffix}")
@@ -87,12 +90,14 @@ class ImageMediaType(str, Enum):
     @classmethod
     def from_extension(cls, ext: str) -> ImageMediaType:
         """Get media type from file extension."""
-        ext_map = {
-            "png": cls.PNG,
-            "jpg": cls.JPEG,
-            "jpeg": cls.JPEG,
-            "gif": cls.GIF,
-            "webp": cls.WEBP,
-            "bmp": cls.BMP,
-        }
-        return ext_map.get(ext.lower(), cls.PNG)
+        return _EXTENSION_MEDIA_TYPES.get(ext.lower(), cls.PNG)
+
+
+_EXTENSION_MEDIA_TYPES: dict[str, ImageMediaType] = {
+    "png": ImageMediaType.PNG,
+    "jpg": ImageMediaType.JPEG,
+    "jpeg": ImageMediaType.JPEG,
+    "gif": ImageMediaType.GIF,
+    "webp": ImageMediaType.WEBP,
+    "bmp": ImageMediaType.BMP,
+}
@@ -1,17 +1,39 @@
 # Infrastructure Layer - External Dependencies
+#
+# Heavy adapters (LightRAG/numpy, PyMuPDF) are imported on first attribute
+# access, so importing lightweight modules such as `config` stays cheap.
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
 
 from .config import settings
 from .file_storage import FileStorage
 from .job_store import FileJobStore, InMemoryJobStore, JobStoreInterface
-from .lightrag_adapter import LightRAGAdapter
 
-try:
+if TYPE_CHECKING:
+    from .lightrag_adapter import LightRAGAdapter
     from .pdf_extractor import PyMuPDFExtractor
 
-    _HAS_PYMUPDF = True
-except ImportError:
-    _HAS_PYMUPDF = False
-    PyMuPDFExtractor = None  # type: ignore
+_HAS_PYMUPDF = importlib.util.find_spec("fitz") is not None
+
+_LAZY_IMPORTS = {
+    "LightRAGAdapter": ".lightrag_adapter",
+    "PyMuPDFExtractor": ".pdf_extractor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name == "PyMuPDFExtractor" and not _HAS_PYMUPDF:
+        return None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
 def get_pdf_extractor() -> PyMuPDFExtractor:
@@ -22,6 +44,8 @@ def get_pdf_extractor() -> PyMuPDFExtractor:
     1. PyMuPDF (AGPL licensed)
     """
     if _HAS_PYMUPDF:
+        from .pdf_extractor import PyMuPDFExtractor
+
         return PyMuPDFExtractor()
     else:
         raise ImportError("No PDF extractor available. Install with:\n  uv add PyMuPDF")
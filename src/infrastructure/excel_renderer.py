@@ -7,8 +7,6 @@ Handles Excel file generation using XlsxWriter with professional styling.
 from datetime import datetime
 from pathlib import Path
 
-import xlsxwriter
-
 from src.domain.table_entities import TableContext
 
 
@@ -30,10 +28,15 @@ class ExcelRenderer:
         Returns:
             Path to the generated file
         """
+        # Imported here so starting the server does not pay for XlsxWriter
+        import xlsxwriter
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         file_path = self.output_dir / f"{filename}_{timestamp}.xlsx"
 
-        workbook = xlsxwriter.Workbook(str(file_path))
+        # Rows are written strictly top to bottom, so each one can be
+        # flushed to disk as soon as the next starts (flat memory use)
+        workbook = xlsxwriter.Workbook(str(file_path), {"constant_memory": True})
         worksheet = workbook.add_worksheet("Data")
 
         # Define Formats
@@ -51,6 +54,12 @@ class ExcelRenderer:
         cell_format = workbook.add_format(
             {"border": 1, "valign": "top", "text_wrap": True}
         )
+        high_format = workbook.add_format(
+            {"bg_color": "#C6EFCE", "font_color": "#006100", "border": 1}
+        )
+        low_format = workbook.add_format(
+            {"bg_color": "#FFC7CE", "font_color": "#9C0006", "border": 1}
+        )
 
         # Write Title
         title_format = workbook.add_format({"bold": True, "font_size": 14})
@@ -66,47 +75,42 @@ class ExcelRenderer:
         # Write Headers
         for col_idx, col in enumerate(context.columns):
             worksheet.write(start_row, col_idx, col.name, header_format)
-            # Set initial column width
-            worksheet.set_column(col_idx, col_idx, 15)
+
+        # Comparison specific: highlight confidence
+        highlight = [
+            context.intent == "comparison" and col.name.lower() == "confidence"
+            for col in context.columns
+        ]
+        # Longest text per column, for the width adjustment below
+        max_lens = [len(col.name) for col in context.columns]
 
         # Write Data
         for row_idx, row_data in enumerate(context.rows):
             current_row = start_row + 1 + row_idx
             for col_idx, col in enumerate(context.columns):
                 val = row_data.get(col.name, "")
+                text = str(val)
+                if len(text) > max_lens[col_idx]:
+                    max_lens[col_idx] = len(text)
 
                 # Apply specific formatting based on intent and value
                 fmt = cell_format
-
-                # Comparison specific: highlight confidence
-                if context.intent == "comparison" and col.name.lower() == "confidence":
-                    if str(val).lower() == "high":
-                        fmt = workbook.add_format(
-                            {
-                                "bg_color": "#C6EFCE",
-                                "font_color": "#006100",
-                                "border": 1,
-                            }
-                        )
-                    elif str(val).lower() == "low":
-                        fmt = workbook.add_format(
-                            {
-                                "bg_color": "#FFC7CE",
-                                "font_color": "#9C0006",
-                                "border": 1,
-                            }
-                        )
+                if highlight[col_idx]:
+                    if text.lower() == "high":
+                        fmt = high_format
+                    elif text.lower() == "low":
+                        fmt = low_format
 
                 # Write value
                 if col.type == "number" and isinstance(val, int | float):
                     worksheet.write_number(current_row, col_idx, val, fmt)
                 elif col.type == "url" and val:
                     worksheet.write_url(
-                        current_row, col_idx, str(val), string=str(val), cell_format=fmt
+                        current_row, col_idx, text, string=text, cell_format=fmt
                     )
                 else:
                     worksheet.write(
-                        current_row, col_idx, str(val) if val is not None else "", fmt
+                        current_row, col_idx, text if val is not None else "", fmt
                     )
 
         # Add Data Bars for numeric columns in comparison mode
@@ -121,16 +125,9 @@ class ExcelRenderer:
                         {"type": "data_bar", "bar_color": "#3498DB"},
                     )
 
-        # Auto-adjust column widths (basic implementation)
-        for col_idx, col in enumerate(context.columns):
-            max_len = len(col.name)
-            for row in context.rows:
-                val = row.get(col.name, "")
-                max_len = max(max_len, len(str(val)))
-
-            # Cap width at 50
-            width = min(max_len + 2, 50)
-            worksheet.set_column(col_idx, col_idx, width)
+        # Auto-adjust column widths (basic implementation), capped at 50
+        for col_idx, max_len in enumerate(max_lens):
+            worksheet.set_column(col_idx, col_idx, min(max_len + 2, 50))
 
         workbook.close()
         return file_path
@@ -6,10 +6,14 @@ Implementation of DocumentRepository using local filesystem.
 
 from __future__ import annotations
 
-import json
+import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from pydantic import TypeAdapter
+
 from src.domain.entities import DocumentManifest, DocumentSummary
 from src.domain.repositories import DocumentRepository
 
@@ -18,6 +22,11 @@ from .config import settings
 if TYPE_CHECKING:
     pass
 
+logger = logging.getLogger(__name__)
+
+_SUMMARY_LIST = TypeAdapter(list[DocumentSummary])
+_MANIFEST = TypeAdapter(DocumentManifest)
+
 
 class FileStorage(DocumentRepository):
     """
@@ -25,13 +34,18 @@ class FileStorage(DocumentRepository):
 
     Stores documents in local filesystem with structure:
     data/
+    ├── documents_index.json
     └── {doc_id}/
         ├── {doc_id}_full.md
         ├── {doc_id}_manifest.json
-        └── images/
-            └── fig_1_1.png
+        ├── images/
+        │   └── fig_1_1.png
+        └── rendered/
+            └── outline.v1.md  (view name as given by the caller)
     """
 
+    INDEX_NAME = "documents_index.json"
+
     def __init__(self, base_dir: Path | None = None):
         """
         Initialize file storage.
@@ -42,36 +56,111 @@ class FileStorage(DocumentRepository):
         self.base_dir = base_dir or settings.data_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        # doc_id -> (manifest file mtime_ns, parsed manifest)
+        self._manifest_cache: dict[str, tuple[int, DocumentManifest]] = {}
+
+        # One summary per document, so listing never opens every manifest
+        self.index_path = self.base_dir / self.INDEX_NAME
+        self._index: dict[str, DocumentSummary] | None = None
+        self._index_mtime = 0
+
     def get_doc_dir(self, doc_id: str) -> Path:
         """Get directory for a specific document."""
         doc_dir = self.base_dir / doc_id
         doc_dir.mkdir(parents=True, exist_ok=True)
         return doc_dir
 
+    def _manifest_path(self, doc_id: str) -> Path:
+        """Get manifest file path (without creating the document dir)."""
+        return self.base_dir / doc_id / f"{doc_id}_manifest.json"
+
     def save_manifest(self, manifest: DocumentManifest) -> None:
         """Save document manifest as JSON."""
-        doc_dir = self.get_doc_dir(manifest.doc_id)
-        manifest_path = doc_dir / f"{manifest.doc_id}_manifest.json"
+        self.get_doc_dir(manifest.doc_id)
+        manifest_path = self._manifest_path(manifest.doc_id)
 
         # Update manifest path
         manifest.manifest_path = str(manifest_path)
 
-        manifest_path.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+        # Encode straight to UTF-8 bytes (no intermediate str)
+        manifest_path.write_bytes(_MANIFEST.dump_json(manifest, indent=2))
+        self._manifest_cache[manifest.doc_id] = (
+            manifest_path.stat().st_mtime_ns,
+            manifest,
+        )
+
+        # Renderings of the previous manifest are stale now
+        rendered_dir = self.base_dir / manifest.doc_id / "rendered"
+        if rendered_dir.is_dir():
+            for path in rendered_dir.glob("*.md"):
+                path.unlink(missing_ok=True)
+
+        index = self._load_index()
+        index[manifest.doc_id] = DocumentSummary.from_manifest(manifest)
+        self._write_index()
 
     def load_manifest(self, doc_id: str) -> DocumentManifest | None:
-        """Load document manifest by ID."""
-        doc_dir = self.get_doc_dir(doc_id)
-        manifest_path = doc_dir / f"{doc_id}_manifest.json"
+        """
+        Load document manifest by ID.
 
-        if not manifest_path.exists():
+        Parsed manifests are cached and reused while the file's mtime is
+        unchanged, so repeated lookups cost a single stat().
+        """
+        manifest_path = self._manifest_path(doc_id)
+
+        try:
+            mtime = manifest_path.stat().st_mtime_ns
+        except OSError:
+            self._manifest_cache.pop(doc_id, None)
             return None
 
+        cached = self._manifest_cache.get(doc_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         try:
-            data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            return DocumentManifest.model_validate(data)
+            manifest = DocumentManifest.model_validate_json(manifest_path.read_bytes())
         except Exception:
             return None
 
+        self._manifest_cache[doc_id] = (mtime, manifest)
+        return manifest
+
+    def invalidate_manifest(self, doc_id: str | None = None) -> None:
+        """Drop cached manifests (all documents when doc_id is None)."""
+        if doc_id is None:
+            self._manifest_cache.clear()
+        else:
+            self._manifest_cache.pop(doc_id, None)
+
+    def load_rendered(self, doc_id: str, view: str) -> str | None:
+        """Load a stored Markdown rendering of a document view."""
+        rendered_path = self.base_dir / doc_id / "rendered" / f"{view}.md"
+        try:
+            return rendered_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def save_rendered(self, doc_id: str, view: str, content: str) -> None:
+        """Store a Markdown rendering of a document view (known documents only)."""
+        if not self.document_exists(doc_id):
+            return
+        rendered_dir = self.base_dir / doc_id / "rendered"
+        try:
+            rendered_dir.mkdir(exist_ok=True)
+            # Unique temp name: concurrent reads of one view may save at once
+            fd, tmp_name = tempfile.mkstemp(dir=rendered_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(tmp_name, rendered_dir / f"{view}.md")
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            # Only a cache; the view is simply rendered again next time
+            logger.warning(f"Could not store rendered {view} for {doc_id}: {e}")
+
     def save_markdown(self, doc_id: str, content: str) -> Path:
         """Save markdown content and return path."""
         doc_dir = self.get_doc_dir(doc_id)
@@ -81,14 +170,12 @@ class FileStorage(DocumentRepository):
 
     def load_markdown(self, doc_id: str) -> str | None:
         """Load markdown content by doc ID."""
-        doc_dir = self.get_doc_dir(doc_id)
-        markdown_path = doc_dir / f"{doc_id}_full.md"
-
-        if not markdown_path.exists():
+        markdown_path = self.base_dir / doc_id / f"{doc_id}_full.md"
+        try:
+            return markdown_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return None
 
-        return markdown_path.read_text(encoding="utf-8")
-
     def save_image(self, doc_id: str, image_id: str, data: bytes, ext: str) -> Path:
         """Save image and return path."""
         doc_dir = self.get_doc_dir(doc_id)
@@ -101,48 +188,91 @@ class FileStorage(DocumentRepository):
 
     def load_image(self, doc_id: str, image_id: str) -> bytes | None:
         """Load image bytes by ID."""
-        doc_dir = self.get_doc_dir(doc_id)
-        images_dir = doc_dir / "images"
+        images_dir = self.base_dir / doc_id / "images"
 
         # Try common extensions
-        for ext in ["png", "jpg", "jpeg", "gif", "webp"]:
-            image_path = images_dir / f"{image_id}.{ext}"
-            if image_path.exists():
-                return image_path.read_bytes()
+        for ext in ("png", "jpg", "jpeg", "gif", "webp"):
+            try:
+                return (images_dir / f"{image_id}.{ext}").read_bytes()
+            except FileNotFoundError:
+                continue
 
         return None
 
     def list_documents(self) -> list[DocumentSummary]:
-        """List all processed documents."""
-        documents = []
+        """List all processed documents (served from the documents index)."""
+        index = self._load_index()
+        # Documents deleted behind our back would otherwise stay listed
+        stale = [doc_id for doc_id in index if not self.document_exists(doc_id)]
+        if stale:
+            for doc_id in stale:
+                del index[doc_id]
+            self._write_index()
+        return list(index.values())
+
+    # ------------------------------------------------------------------
+    # Documents index
+    # ------------------------------------------------------------------
+
+    def _scan_documents(self) -> dict[str, DocumentSummary]:
+        """Build summaries by reading every manifest (index rebuild)."""
+        documents: dict[str, DocumentSummary] = {}
+
+        # scandir entries carry their file type, so no extra stat per entry
+        with os.scandir(self.base_dir) as entries:
+            doc_names = [
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                # Skip special directories
+                and not entry.name.startswith(".")
+                and entry.name != "lightrag_db"
+            ]
+
+        for doc_name in doc_names:
+            manifest = self.load_manifest(doc_name)
+            if manifest:
+                documents[manifest.doc_id] = DocumentSummary.from_manifest(manifest)
 
-        for doc_dir in self.base_dir.iterdir():
-            if not doc_dir.is_dir():
-                continue
+        return documents
 
-            # Skip special directories
-            if doc_dir.name.startswith(".") or doc_dir.name == "lightrag_db":
-                continue
+    def _load_index(self) -> dict[str, DocumentSummary]:
+        """
+        Load the documents index, rebuilding it if missing or unreadable.
 
-            manifest = self.load_manifest(doc_dir.name)
-            if manifest:
-                asset_summary = manifest.get_asset_summary()
-                documents.append(
-                    DocumentSummary(
-                        doc_id=manifest.doc_id,
-                        filename=manifest.filename,
-                        title=manifest.title,
-                        page_count=manifest.page_count,
-                        table_count=asset_summary.get("tables", 0),
-                        figure_count=asset_summary.get("figures", 0),
-                        section_count=asset_summary.get("sections", 0),
-                        created_at=manifest.created_at,
-                    )
-                )
+        The parsed index is reused while the file's mtime is unchanged.
+        """
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except OSError:
+            return self._rebuild_index()
 
-        return documents
+        if self._index is not None and self._index_mtime == mtime:
+            return self._index
+
+        try:
+            summaries = _SUMMARY_LIST.validate_json(self.index_path.read_bytes())
+        except Exception:
+            return self._rebuild_index()
+
+        self._index = {summary.doc_id: summary for summary in summaries}
+        self._index_mtime = mtime
+        return self._index
+
+    def _rebuild_index(self) -> dict[str, DocumentSummary]:
+        """Rescan manifests and persist a fresh index."""
+        self._index = self._scan_documents()
+        self._write_index()
+        return self._index
+
+    def _write_index(self) -> None:
+        """Atomically persist the in-memory index."""
+        summaries = list((self._index or {}).values())
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_SUMMARY_LIST.dump_json(summaries, indent=2))
+        os.replace(tmp_path, self.index_path)
+        self._index_mtime = self.index_path.stat().st_mtime_ns
 
     def document_exists(self, doc_id: str) -> bool:
         """Check if document exists."""
-        manifest_path = self.base_dir / doc_id / f"{doc_id}_manifest.json"
-        return manifest_path.exists()
+        return self._manifest_path(doc_id).exists()
@@ -6,12 +6,17 @@ Persistent storage for ETL jobs.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import heapq
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
+
+from .serialization import dumps_line, loads
 
 if TYPE_CHECKING:
     from src.domain.job import Job, JobSummary
@@ -60,11 +65,24 @@ class JobStoreInterface(ABC):
 
 class FileJobStore(JobStoreInterface):
     """
-    File-based job store.
-
-    Stores each job as a JSON file for persistence across restarts.
+    File-backed job store.
+
+    Jobs are served from an in-memory index. Every mutation is appended as
+    one NDJSON record to ``jobs/jobs.log``, which is replayed on startup so
+    state survives restarts. Records are queued and written in batches by a
+    background task in a worker thread, so progress updates never block the
+    event loop; progress polling never touches the disk. The store keeps its
+    own copies of jobs: mutating a job passed in or handed out has no effect
+    until it is passed to update().
+    Non-terminal job IDs are tracked separately so listing active jobs does
+    not walk the whole history.
     """
 
+    LOG_NAME = "jobs.log"
+
+    # Rewrite the journal once it holds this many superseded records
+    COMPACT_THRESHOLD = 1000
+
     def __init__(self, data_dir: str | Path) -> None:
         """
         Initialize file job store.
@@ -74,116 +92,234 @@ class FileJobStore(JobStoreInterface):
         """
         self.jobs_dir = Path(data_dir) / "jobs"
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.jobs_dir / self.LOG_NAME
 
-    def _job_path(self, job_id: str) -> Path:
-        """Get file path for a job."""
-        return self.jobs_dir / f"{job_id}.json"
+        self._jobs: dict[str, Job] = {}
+        # Non-terminal job IDs, in creation order (dict used as ordered set)
+        self._active: dict[str, None] = {}
+        self._lock = asyncio.Lock()
+        self._log: TextIO | None = None
+        self._log_records = 0
+        # Serialized records not yet written, and the task writing them
+        self._pending: list[str] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # Guards the log file; the generation changes on every rewrite so a
+        # batch taken before a compaction is not appended after it
+        self._io_lock = threading.Lock()
+        self._generation = 0
+
+        self._replay()
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+
+    def _replay(self) -> None:
+        """Rebuild the in-memory index from the journal (and legacy files)."""
+        from src.domain.job import Job
+
+        legacy = self._load_legacy_files()
+        # Set when a line is unreadable or unterminated; appending after it
+        # would glue the next record onto the fragment
+        torn = False
+
+        if self.log_path.exists():
+            with open(self.log_path, encoding="utf-8") as f:
+                for lineno, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    self._log_records += 1
+                    torn = torn or not line.endswith("\n")
+                    try:
+                        record = loads(line)
+                        if record["op"] == "put":
+                            job = Job.model_validate(record["job"])
+                            self._jobs[job.job_id] = job
+                        elif record["op"] == "del":
+                            self._jobs.pop(record["job_id"], None)
+                    except Exception as e:
+                        # A torn final line after a crash is expected; skip it
+                        logger.warning(f"Skipping bad job log line {lineno}: {e}")
+                        torn = True
+
+        if legacy:
+            for _, job in legacy:
+                self._jobs.setdefault(job.job_id, job)
+            self.compact()
+            # Only files that were imported; unreadable ones were set aside
+            for path, _ in legacy:
+                path.unlink()
+            logger.info(f"Migrated {len(legacy)} legacy job files to {self.LOG_NAME}")
+        elif torn or self._log_records - len(self._jobs) > self.COMPACT_THRESHOLD:
+            self.compact()
+
+        self._active = {
+            job_id: None for job_id, job in self._jobs.items() if not job.is_terminal
+        }
+
+    def _load_legacy_files(self) -> list[tuple[Path, Job]]:
+        """
+        Load jobs stored by older versions as one JSON file per job.
+
+        Files that cannot be parsed are renamed to ``*.json.bad`` and kept.
+        """
+        from src.domain.job import Job
+
+        jobs: list[tuple[Path, Job]] = []
+        for path in self.jobs_dir.glob("*.json"):
+            try:
+                jobs.append((path, Job.model_validate_json(path.read_bytes())))
+            except Exception as e:
+                logger.warning(f"Error loading job {path.stem}, kept as .bad: {e}")
+                path.replace(path.with_suffix(".json.bad"))
+        return jobs
+
+    def _append(self, record: dict[str, object]) -> None:
+        """Queue one record for the journal and make sure a writer is running."""
+        self._pending.append(dumps_line(record) + "\n")
+        self._log_records += 1
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_pending()
+            )
+
+    async def _flush_pending(self) -> None:
+        """Write queued records in batches, compacting when the log bloats."""
+        while self._pending:
+            lines, self._pending = self._pending, []
+            await asyncio.to_thread(self._write_lines, lines, self._generation)
+            if (
+                not self._pending
+                and self._log_records - len(self._jobs) > self.COMPACT_THRESHOLD
+            ):
+                await asyncio.to_thread(self._rewrite, self._snapshot_lines())
+
+    async def flush(self) -> None:
+        """Wait until every queued journal record is on disk."""
+        if self._flush_task is not None:
+            await self._flush_task
+
+    def _write_lines(self, lines: list[str], generation: int) -> None:
+        with self._io_lock:
+            if generation != self._generation:
+                return  # superseded by a compaction taken after these records
+            if self._log is None:
+                # Append mode maps to O_APPEND; the handle stays open
+                self._log = open(self.log_path, "a", encoding="utf-8")
+            self._log.writelines(lines)
+            self._log.flush()
+
+    def _snapshot_lines(self) -> list[str]:
+        """One put record per live job; resets the superseded-record count."""
+        lines = [
+            dumps_line({"op": "put", "job": job.model_dump(mode="json")}) + "\n"
+            for job in self._jobs.values()
+        ]
+        self._log_records = len(lines)
+        return lines
+
+    def _rewrite(self, lines: list[str]) -> None:
+        """Atomically replace the journal with ``lines``."""
+        with self._io_lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            tmp_path = self.log_path.with_suffix(".log.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            os.replace(tmp_path, self.log_path)
+            self._generation += 1
+
+    def _put(self, job: Job) -> None:
+        job = job.model_copy(deep=True)
+        self._jobs[job.job_id] = job
+        if job.is_terminal:
+            self._active.pop(job.job_id, None)
+        else:
+            self._active[job.job_id] = None
+        self._append({"op": "put", "job": job.model_dump(mode="json")})
+
+    def compact(self) -> None:
+        """Rewrite the journal so it holds exactly one record per live job."""
+        lines = self._snapshot_lines()
+        # Queued records are already reflected in the in-memory snapshot
+        self._pending.clear()
+        self._rewrite(lines)
+
+    def close(self) -> None:
+        """Compact the journal and release the file handle (graceful shutdown)."""
+        self.compact()
+
+    # ------------------------------------------------------------------
+    # JobStoreInterface
+    # ------------------------------------------------------------------
 
     async def create(self, job: Job) -> Job:
         """Create a new job."""
-        path = self._job_path(job.job_id)
-        if path.exists():
-            raise ValueError(f"Job {job.job_id} already exists")
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(job.model_dump(mode="json"), f, indent=2, default=str)
+        async with self._lock:
+            if job.job_id in self._jobs:
+                raise ValueError(f"Job {job.job_id} already exists")
+            self._put(job)
 
         logger.info(f"Created job: {job.job_id}")
         return job
 
     async def get(self, job_id: str) -> Job | None:
-        """Get a job by ID."""
-        from src.domain.job import Job
-
-        path = self._job_path(job_id)
-        if not path.exists():
-            return None
-
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            return Job.model_validate(data)
-        except Exception as e:
-            logger.error(f"Error loading job {job_id}: {e}")
-            return None
+        """Get a copy of a job by ID."""
+        job = self._jobs.get(job_id)
+        return None if job is None else job.model_copy(deep=True)
 
     async def update(self, job: Job) -> Job:
         """Update an existing job."""
-        path = self._job_path(job.job_id)
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(job.model_dump(mode="json"), f, indent=2, default=str)
-
+        async with self._lock:
+            self._put(job)
         return job
 
     async def delete(self, job_id: str) -> bool:
         """Delete a job."""
-        path = self._job_path(job_id)
-        if path.exists():
-            path.unlink()
-            logger.info(f"Deleted job: {job_id}")
-            return True
-        return False
+        async with self._lock:
+            if job_id not in self._jobs:
+                return False
+            del self._jobs[job_id]
+            self._active.pop(job_id, None)
+            self._append({"op": "del", "job_id": job_id})
+
+        logger.info(f"Deleted job: {job_id}")
+        return True
 
     async def list_all(self, limit: int = 50) -> list[JobSummary]:
         """List all jobs (most recent first)."""
-        from src.domain.job import Job, JobSummary
-
-        jobs: list[tuple[datetime, JobSummary]] = []
-
-        for path in self.jobs_dir.glob("*.json"):
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                job = Job.model_validate(data)
-                jobs.append((job.created_at, JobSummary.from_job(job)))
-            except Exception as e:
-                logger.warning(f"Error loading job {path.stem}: {e}")
-
-        # Sort by created_at descending
-        jobs.sort(key=lambda x: x[0], reverse=True)
+        from src.domain.job import JobSummary
 
-        return [summary for _, summary in jobs[:limit]]
+        jobs = heapq.nlargest(limit, self._jobs.values(), key=lambda j: j.created_at)
+        return [JobSummary.from_job(job) for job in jobs]
 
     async def list_active(self) -> list[JobSummary]:
         """List active (non-terminal) jobs."""
-        from src.domain.job import Job, JobSummary
-
-        active: list[JobSummary] = []
-
-        for path in self.jobs_dir.glob("*.json"):
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                job = Job.model_validate(data)
-                if not job.is_terminal:
-                    active.append(JobSummary.from_job(job))
-            except Exception as e:
-                logger.warning(f"Error loading job {path.stem}: {e}")
+        from src.domain.job import JobSummary
 
-        return active
+        return [JobSummary.from_job(self._jobs[job_id]) for job_id in self._active]
 
     async def cleanup_old(self, max_age_hours: int = 24) -> int:
         """Delete old completed/failed jobs."""
-        from src.domain.job import Job
-
         cutoff = datetime.now().timestamp() - (max_age_hours * 3600)
-        deleted = 0
 
-        for path in self.jobs_dir.glob("*.json"):
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                job = Job.model_validate(data)
-
-                if job.is_terminal and job.created_at.timestamp() < cutoff:
-                    path.unlink()
-                    deleted += 1
-                    logger.info(f"Cleaned up old job: {job.job_id}")
-            except Exception as e:
-                logger.warning(f"Error checking job {path.stem}: {e}")
+        async with self._lock:
+            to_delete = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.is_terminal and job.created_at.timestamp() < cutoff
+            ]
+            if not to_delete:
+                return 0
+
+            for job_id in to_delete:
+                del self._jobs[job_id]
+                self._active.pop(job_id, None)
+                logger.info(f"Cleaned up old job: {job_id}")
+            self.compact()
 
-        return deleted
+        return len(to_delete)
 
 
 class InMemoryJobStore(JobStoreInterface):
@@ -222,8 +358,8 @@ class InMemoryJobStore(JobStoreInterface):
         """List all jobs."""
         from src.domain.job import JobSummary
 
-        jobs = sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
-        return [JobSummary.from_job(job) for job in jobs[:limit]]
+        jobs = heapq.nlargest(limit, self._jobs.values(), key=lambda j: j.created_at)
+        return [JobSummary.from_job(job) for job in jobs]
 
     async def list_active(self) -> list[JobSummary]:
         """List active jobs."""
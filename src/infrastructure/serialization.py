@@ -0,0 +1,56 @@
+"""
+Infrastructure Layer - JSON Serialization
+
+JSON helpers backed by orjson when installed (``speedups`` extra),
+falling back to the stdlib ``json`` module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+
+def dumps_pretty(obj: Any) -> str:
+    """
+    Serialize to 2-space indented JSON, keeping non-ASCII text as-is.
+
+    Equivalent to ``json.dumps(obj, indent=2, ensure_ascii=False)``.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; let the stdlib handle it
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def dumps_line(obj: Any) -> str:
+    """
+    Serialize to single-line JSON, keeping non-ASCII text as-is.
+
+    Values JSON cannot represent are stringified (``default=str``).
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=str).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -7,9 +7,15 @@ Supports async ETL jobs for long-running document processing.
 
 from __future__ import annotations
 
-import json
-from typing import Any, Literal, cast
-
+import asyncio
+import io
+import re
+from functools import lru_cache
+from itertools import islice
+from string import Template
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+
+import anyio
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ImageContent, TextContent
 
@@ -19,30 +25,201 @@ from src.application.job_service import JobService
 from src.application.knowledge_service import KnowledgeService
 from src.application.table_service import table_service
 from src.domain.job import JobStatus
+from src.domain.tokens import estimate_text_tokens
 from src.infrastructure.config import settings
 from src.infrastructure.file_storage import FileStorage
 from src.infrastructure.job_store import FileJobStore
-from src.infrastructure.lightrag_adapter import LightRAGAdapter
-from src.infrastructure.pdf_extractor import PyMuPDFExtractor
+from src.infrastructure.serialization import dumps_pretty
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from src.infrastructure.lightrag_adapter import LightRAGAdapter
 
 # Initialize FastMCP server
 mcp = FastMCP("Asset-Aware Medical RAG")
 
-# Initialize infrastructure
-_repository = FileStorage(settings.data_dir)
-_pdf_extractor = PyMuPDFExtractor()  # Lightweight, always available
-_knowledge_graph = LightRAGAdapter() if settings.enable_lightrag else None
-_job_store = FileJobStore(settings.data_dir)
-
-# Initialize application services
-_document_service = DocumentService(
-    repository=_repository,
-    pdf_extractor=_pdf_extractor,
-    knowledge_graph=_knowledge_graph,
+
+# ============================================================================
+# Lazy singletons
+#
+# Infrastructure and services are built on first use so that starting the
+# server (or importing it in tests) does not pay for LightRAG/numpy or
+# PyMuPDF until a tool actually needs them.
+# ============================================================================
+
+
+@lru_cache(maxsize=1)
+def _repository() -> FileStorage:
+    return FileStorage(settings.data_dir)
+
+
+@lru_cache(maxsize=1)
+def _knowledge_graph() -> LightRAGAdapter | None:
+    if not settings.enable_lightrag:
+        return None
+    from src.infrastructure.lightrag_adapter import LightRAGAdapter
+
+    return LightRAGAdapter()
+
+
+@lru_cache(maxsize=1)
+def _job_store() -> FileJobStore:
+    return FileJobStore(settings.data_dir)
+
+
+@lru_cache(maxsize=1)
+def _document_service() -> DocumentService:
+    from src.infrastructure.pdf_extractor import PyMuPDFExtractor
+
+    return DocumentService(
+        repository=_repository(),
+        pdf_extractor=PyMuPDFExtractor(),
+        knowledge_graph=_knowledge_graph(),
+    )
+
+
+@lru_cache(maxsize=1)
+def _asset_service() -> AssetService:
+    return AssetService(repository=_repository())
+
+
+@lru_cache(maxsize=1)
+def _knowledge_service() -> KnowledgeService:
+    return KnowledgeService(knowledge_graph=_knowledge_graph())
+
+
+@lru_cache(maxsize=1)
+def _job_service() -> JobService:
+    return JobService(job_store=_job_store(), document_service=_document_service())
+
+
+class _GraphSummary(TypedDict, total=False):
+    """Shape of `export_graph(format="summary")` results."""
+
+    total_nodes: int
+    total_edges: int
+    entity_types: dict[str, int]
+    sample_nodes: list[dict[str, str]]
+    sample_edges: list[dict[str, str]]
+
+
+_STATUS_EMOJI: dict[JobStatus, str] = {
+    JobStatus.PENDING: "⏳",
+    JobStatus.PROCESSING: "🔄",
+    JobStatus.COMPLETED: "✅",
+    JobStatus.FAILED: "❌",
+    JobStatus.CANCELLED: "🚫",
+}
+
+# Pre-rendered progress bars, one per 5% step (0-100%)
+_PROGRESS_BARS: tuple[str, ...] = tuple(
+    f"[{'█' * i}{'░' * (20 - i)}]" for i in range(21)
+)
+
+# Section outline indents by heading depth (level 1 is flush left)
+_INDENTS: tuple[str, ...] = tuple("  " * i for i in range(8))
+
+# Rendered resources, reused while DocumentService.version is unchanged
+_doc_list_cache: tuple[int, str] | None = None
+# Bump when any _render_document_* output changes, so renderings stored on
+# disk by an older version are not served
+_RENDER_VERSION = 1
+
+# (doc_id, view) -> rendering, for existing documents only; cleared on ingest
+_doc_resource_cache: dict[tuple[str, str], str] = {}
+_doc_resource_version = 0
+_kg_cache_version = 0
+
+# Last JSON graph export, reused while the service hands back the same result
+_kg_json_cache: tuple[dict[str, object], str] | None = None
+
+
+def _synced_knowledge_service() -> KnowledgeService:
+    """Knowledge service with caches dropped if documents were ingested since."""
+    global _kg_cache_version
+    service = _knowledge_service()
+    version = _document_service().version
+    if _kg_cache_version != version:
+        service.invalidate_cache()
+        _kg_cache_version = version
+    return service
+
+
+def _trunc(text: str | None, limit: int, placeholder: str = "-") -> str:
+    """Shorten text to `limit` chars plus an ellipsis; placeholder if empty."""
+    if not text:
+        return placeholder
+    return f"{text[:limit]}..." if len(text) > limit else text
+
+
+def _page_note(offset: int, shown: int, total: int, noun: str) -> str:
+    """Footer for a paged listing; empty when everything was shown."""
+    if shown >= total:
+        return ""
+    return f"\n\n*(Showing {offset + 1}-{offset + shown} of {total} {noun})*"
+
+
+def _render_section(section_id: str, page: int | None, content: str) -> str:
+    """Render one section with its page and token estimate header."""
+    return (
+        f"## Section: {section_id}\n"
+        f"**Page:** {page or 'Unknown'}\n"
+        f"**Est. Tokens:** ~{estimate_text_tokens(content)}\n"
+        "\n"
+        "---\n"
+        "\n"
+        f"{content}"
+    )
+
+
+# plan_table_schema intent detection, checked in order (first match wins)
+_INTENT_RULES = [
+    (
+        "comparison",
+        re.compile(r"比較|compare|vs|差異|different", re.IGNORECASE),
+        "問題涉及比較分析",
+    ),
+    (
+        "citation",
+        re.compile(r"引用|cite|reference|來源|source", re.IGNORECASE),
+        "問題需要引用來源",
+    ),
+]
+
+# plan_table_schema suggested columns per intent
+_COLUMN_TEMPLATES = {
+    "comparison": (
+        "| Column | Type | Purpose |\n"
+        "|--------|------|---------|\n"
+        "| 項目/Item | text | 比較的對象 |\n"
+        "| 特徵1 | text | 第一個比較維度 |\n"
+        "| 特徵2 | text | 第二個比較維度 |\n"
+        "| 差異/Notes | text | 關鍵差異說明 |"
+    ),
+    "citation": (
+        "| Column | Type | Purpose |\n"
+        "|--------|------|---------|\n"
+        "| 來源/Source | text | 引用來源 |\n"
+        "| 頁碼/Page | number | 頁碼 |\n"
+        "| 內容/Content | text | 引用內容 |\n"
+        "| 備註/Notes | text | 補充說明 |"
+    ),
+    "summary": (
+        "| Column | Type | Purpose |\n"
+        "|--------|------|---------|\n"
+        "| 主題/Topic | text | 主題項目 |\n"
+        "| 說明/Description | text | 詳細說明 |\n"
+        "| 公式/Formula | text | 相關公式（如有） |\n"
+        "| 備註/Notes | text | 補充說明 |"
+    ),
+}
+
+_MERMAID_TMPL = Template(
+    "## Knowledge Graph Visualization\n\n"
+    "**Nodes:** $nodes | **Edges:** $edges\n\n"
+    "```mermaid\n$diagram\n```\n"
 )
-_asset_service = AssetService(repository=_repository)
-_knowledge_service = KnowledgeService(knowledge_graph=_knowledge_graph)
-_job_service = JobService(job_store=_job_store, document_service=_document_service)
 
 
 # ============================================================================
@@ -83,7 +260,7 @@ async def ingest_documents(
     """
     if async_mode:
         # Create async job and return immediately
-        job = await _job_service.create_ingest_job(file_paths)
+        job = await _job_service().create_ingest_job(file_paths)
 
         return (
             f"# 📋 ETL Job Created\n\n"
@@ -95,7 +272,7 @@ async def ingest_documents(
         )
     else:
         # Sync mode - wait for completion (original behavior)
-        results = await _document_service.ingest(file_paths)
+        results = await _document_service().ingest(file_paths)
 
         output_lines = ["# Ingestion Results\n"]
         success_count = sum(1 for r in results if r.success)
@@ -136,22 +313,13 @@ async def get_job_status(job_id: str) -> str:
     Example:
         get_job_status("job_20251226_143000_abc12345")
     """
-    job = await _job_service.get_job(job_id)
+    job = await _job_service().get_job(job_id)
 
     if job is None:
         return f"❌ Job not found: `{job_id}`"
 
-    # Status emoji
-    status_emoji = {
-        JobStatus.PENDING: "⏳",
-        JobStatus.PROCESSING: "🔄",
-        JobStatus.COMPLETED: "✅",
-        JobStatus.FAILED: "❌",
-        JobStatus.CANCELLED: "🚫",
-    }
-
     lines = [
-        f"# Job Status: {status_emoji.get(job.status, '❓')} {job.status.value.upper()}\n",
+        f"# Job Status: {_STATUS_EMOJI.get(job.status, '❓')} {job.status.value.upper()}\n",
         f"**Job ID:** `{job.job_id}`",
         f"**Type:** {job.job_type.value}",
         f"**Created:** {job.created_at.strftime('%Y-%m-%d %H:%M:%S')}",
@@ -160,9 +328,8 @@ async def get_job_status(job_id: str) -> str:
     # Progress bar
     if not job.is_terminal:
         progress = job.progress.percentage
-        bar_filled = int(progress / 5)
-        bar_empty = 20 - bar_filled
-        progress_bar = f"[{'█' * bar_filled}{'░' * bar_empty}] {progress:.0f}%"
+        bar = _PROGRESS_BARS[min(max(int(progress) // 5, 0), 20)]
+        progress_bar = f"{bar} {progress:.0f}%"
         lines.append(f"\n**Progress:** {progress_bar}")
         lines.append(f"**Phase:** {job.progress.current_phase}")
         lines.append(f"**Status:** {job.progress.message}")
@@ -203,10 +370,10 @@ async def list_jobs(active_only: bool = False) -> str:
         List of jobs with status and progress
     """
     if active_only:
-        jobs = await _job_service.list_active_jobs()
+        jobs = await _job_service().list_active_jobs()
         title = "Active Jobs"
     else:
-        jobs = await _job_service.list_jobs(limit=20)
+        jobs = await _job_service().list_jobs(limit=20)
         title = "Recent Jobs"
 
     if not jobs:
@@ -214,39 +381,34 @@ async def list_jobs(active_only: bool = False) -> str:
             return "No active jobs. All ETL tasks have completed."
         return "No jobs found. Use `ingest_documents` to process files."
 
-    status_emoji = {
-        JobStatus.PENDING: "⏳",
-        JobStatus.PROCESSING: "🔄",
-        JobStatus.COMPLETED: "✅",
-        JobStatus.FAILED: "❌",
-        JobStatus.CANCELLED: "🚫",
-    }
-
-    lines = [f"# {title} ({len(jobs)})\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {title} ({len(jobs)})\n\n")
 
-    for job in jobs:
-        emoji = status_emoji.get(job.status, "❓")
+    for i, job in enumerate(jobs):
+        emoji = _STATUS_EMOJI.get(job.status, "❓")
         progress = (
             f"{job.progress_percentage:.0f}%"
             if job.progress_percentage < 100
             else "Done"
         )
 
-        lines.append(f"## {emoji} `{job.job_id}`")
-        lines.append(f"- **Type:** {job.job_type.value}")
-        lines.append(f"- **Status:** {job.status.value} ({progress})")
+        if i:
+            w("\n")
+        w(
+            f"## {emoji} `{job.job_id}`\n"
+            f"- **Type:** {job.job_type.value}\n"
+            f"- **Status:** {job.status.value} ({progress})\n"
+        )
         if job.current_phase:
-            lines.append(f"- **Phase:** {job.current_phase}")
+            w(f"- **Phase:** {job.current_phase}\n")
         if job.message:
-            lines.append(f"- **Message:** {job.message}")
+            w(f"- **Message:** {job.message}\n")
         if job.error:
-            lines.append(f"- **Error:** {job.error}")
-        lines.append(
-            f"- **Files:** {job.input_file_count} → {job.output_doc_count} docs"
-        )
-        lines.append("")
+            w(f"- **Error:** {job.error}\n")
+        w(f"- **Files:** {job.input_file_count} → {job.output_doc_count} docs\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 @mcp.tool()
@@ -260,7 +422,7 @@ async def cancel_job(job_id: str) -> str:
     Returns:
         Confirmation message
     """
-    success = await _job_service.cancel_job(job_id)
+    success = await _job_service().cancel_job(job_id)
 
     if success:
         return f"🚫 Job `{job_id}` has been cancelled."
@@ -276,24 +438,27 @@ async def list_documents() -> str:
     Returns:
         List of documents with doc_id, title, and asset counts
     """
-    documents = await _document_service.list_documents()
+    documents = await _document_service().list_documents()
 
     if not documents:
         return "No documents found. Use `ingest_documents` to process PDF files."
 
-    output_lines = [f"# Documents ({len(documents)} total)\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Documents ({len(documents)} total)\n")
 
     for doc in documents:
-        output_lines.append(f"## {doc.title or doc.filename}")
-        output_lines.append(f"- **doc_id:** `{doc.doc_id}`")
-        output_lines.append(f"- **filename:** {doc.filename}")
-        output_lines.append(f"- **tables:** {doc.table_count}")
-        output_lines.append(f"- **figures:** {doc.figure_count}")
-        output_lines.append(f"- **sections:** {doc.section_count}")
-        output_lines.append(f"- **ingested:** {doc.ingested_at}")
-        output_lines.append("")
+        w(
+            f"\n## {doc.title or doc.filename}\n"
+            f"- **doc_id:** `{doc.doc_id}`\n"
+            f"- **filename:** {doc.filename}\n"
+            f"- **tables:** {doc.table_count}\n"
+            f"- **figures:** {doc.figure_count}\n"
+            f"- **sections:** {doc.section_count}\n"
+            f"- **ingested:** {doc.ingested_at}\n"
+        )
 
-    return "\n".join(output_lines)
+    return buf.getvalue()
 
 
 @mcp.tool()
@@ -316,58 +481,84 @@ async def inspect_document_manifest(doc_id: str) -> str:
     Returns:
         Structured manifest in markdown format
     """
-    manifest = await _document_service.get_manifest(doc_id)
+    manifest = await _document_service().get_manifest(doc_id)
 
     if not manifest:
         return f"Document not found: `{doc_id}`"
 
-    output_lines = [f"# Document Manifest: {manifest.title or manifest.filename}\n"]
-    output_lines.append(f"**doc_id:** `{manifest.doc_id}`")
-    output_lines.append(f"**pages:** {manifest.page_count}")
-    output_lines.append(f"**ingested:** {manifest.ingested_at}")
+    assets = manifest.assets
+    tables, figures, sections = assets.tables, assets.figures, assets.sections
+    entities = manifest.lightrag_entities
+
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        f"# Document Manifest: {manifest.title or manifest.filename}\n"
+        f"\n**doc_id:** `{manifest.doc_id}`"
+        f"\n**pages:** {manifest.page_count}"
+        f"\n**ingested:** {manifest.ingested_at}"
+    )
 
     # Tables section
-    output_lines.append(f"\n## Tables ({len(manifest.assets.tables)})")
-    if manifest.assets.tables:
-        for table in manifest.assets.tables:
-            output_lines.append(f"\n### `{table.id}` (page {table.page})")
-            output_lines.append(f"_{table.caption}_")
-            output_lines.append(f"Rows: {table.row_count}, Cols: {table.col_count}")
+    w(f"\n\n## Tables ({len(tables)})")
+    if tables:
+        for table in tables:
+            w(
+                f"\n\n### `{table.id}` (page {table.page})"
+                f"\n_{table.caption}_"
+                f"\nRows: {table.row_count}, Cols: {table.col_count}"
+            )
     else:
-        output_lines.append("_No tables found_")
+        w("\n_No tables found_")
 
     # Figures section
-    output_lines.append(f"\n## Figures ({len(manifest.assets.figures)})")
-    if manifest.assets.figures:
-        for fig in manifest.assets.figures:
-            output_lines.append(f"\n### `{fig.id}` (page {fig.page})")
+    w(f"\n\n## Figures ({len(figures)})")
+    if figures:
+        for fig in figures:
+            w(f"\n\n### `{fig.id}` (page {fig.page})")
             if fig.caption:
-                output_lines.append(f"_{fig.caption}_")
-            output_lines.append(f"Size: {fig.width}×{fig.height} ({fig.ext})")
+                w(f"\n_{fig.caption}_")
+            w(f"\nSize: {fig.width}×{fig.height} ({fig.ext})")
     else:
-        output_lines.append("_No figures found_")
+        w("\n_No figures found_")
 
     # Sections section
-    output_lines.append(f"\n## Sections ({len(manifest.assets.sections)})")
-    if manifest.assets.sections:
-        for sec in manifest.assets.sections:
-            indent = "  " * (sec.level - 1) if sec.level > 1 else ""
-            output_lines.append(
-                f"{indent}- `{sec.id}`: {sec.title} (L{sec.start_line}-{sec.end_line})"
-            )
+    w(f"\n\n## Sections ({len(sections)})")
+    if sections:
+        for sec in sections:
+            indent = _INDENTS[min(max(sec.level - 1, 0), 7)]
+            w(f"\n{indent}- `{sec.id}`: {sec.title} (L{sec.start_line}-{sec.end_line})")
     else:
-        output_lines.append("_No sections found_")
+        w("\n_No sections found_")
 
     # LightRAG entities
-    if manifest.lightrag_entities:
-        output_lines.append(
-            f"\n## Knowledge Graph Entities ({len(manifest.lightrag_entities)})"
-        )
-        output_lines.append(", ".join(manifest.lightrag_entities[:20]))
-        if len(manifest.lightrag_entities) > 20:
-            output_lines.append(f"... and {len(manifest.lightrag_entities) - 20} more")
+    if entities:
+        w(f"\n\n## Knowledge Graph Entities ({len(entities)})\n")
+        w(manifest.entity_preview(20))
+        if len(entities) > 20:
+            w(f"\n... and {len(entities) - 20} more")
+
+    return buf.getvalue()
+
+
+@mcp.tool()
+async def preview_document_outline(doc_id: str, limit: int = 20) -> str:
+    """
+    Preview a document's outline, listing only its first sections.
+
+    Cheaper than the `document://{doc_id}/outline` resource for long
+    documents; figures and tables are summarized the same way.
 
-    return "\n".join(output_lines)
+    Args:
+        doc_id: Document identifier from ingest_documents or list_documents
+        limit: Maximum number of sections to list (default 20)
+
+    Returns:
+        Document outline in markdown format
+    """
+    if limit < 0:
+        return "❌ Error: limit must be >= 0"
+    return await _render_document_outline(doc_id, limit=limit)
 
 
 @mcp.tool()
@@ -413,12 +604,14 @@ async def fetch_document_asset(
         # Get original image (no resize)
         fetch_document_asset("abc123", "figure", "fig_2_1", max_size=0)
     """
-    result = await _asset_service.fetch_asset(
+    result = await _asset_service().fetch_asset(
         doc_id, asset_type, asset_id, max_size=max_size
     )
 
+    # Content blocks are built from trusted, internally generated data, so
+    # skip pydantic validation with model_construct()
     if not result.success:
-        return [TextContent(type="text", text=f"Error: {result.error}")]
+        return [TextContent.model_construct(type="text", text=f"Error: {result.error}")]
 
     # Format response based on content type
     if result.image_base64:
@@ -431,8 +624,8 @@ async def fetch_document_asset(
             f"**Format:** {result.image_media_type}"
         )
         return [
-            TextContent(type="text", text=metadata),
-            ImageContent(
+            TextContent.model_construct(type="text", text=metadata),
+            ImageContent.model_construct(
                 type="image",
                 data=result.image_base64,
                 mimeType=result.image_media_type or "image/png",
@@ -445,7 +638,7 @@ async def fetch_document_asset(
             lines.append(f"**Page:** {result.page}")
         lines.append("")
         lines.append(result.text_content or "")
-        return [TextContent(type="text", text="\n".join(lines))]
+        return [TextContent.model_construct(type="text", text="\n".join(lines))]
 
 
 @mcp.tool()
@@ -477,7 +670,10 @@ async def consult_knowledge_graph(
         consult_knowledge_graph("What are the dosing recommendations for remimazolam?")
         consult_knowledge_graph("Compare sedation outcomes between propofol and remimazolam", mode="global")
     """
-    return await _knowledge_service.query(query, mode=mode)
+    if _knowledge_graph() is None:
+        return "Error: LightRAG is not enabled. Set ENABLE_LIGHTRAG=true in .env"
+
+    return await _synced_knowledge_service().query(query, mode=mode)
 
 
 @mcp.tool()
@@ -512,56 +708,58 @@ async def export_knowledge_graph(
         # Get full JSON data
         export_knowledge_graph("json", limit=100)
     """
-    if _knowledge_graph is None:
+    if _knowledge_graph() is None:
         return "Error: LightRAG is not enabled. Set ENABLE_LIGHTRAG=true in .env"
 
-    result = await _knowledge_graph.export_graph(
+    result = await _synced_knowledge_service().export_graph(
         format=format,
         limit=limit,
     )
 
     if format == "mermaid" and "diagram" in result:
         # Return mermaid diagram directly for rendering
-        return f"""## Knowledge Graph Visualization
-
-**Nodes:** {result.get("node_count", 0)} | **Edges:** {result.get("edge_count", 0)}
-
-```mermaid
-{result["diagram"]}
-```
-"""
+        return _MERMAID_TMPL.substitute(
+            nodes=result.get("node_count", 0),
+            edges=result.get("edge_count", 0),
+            diagram=result["diagram"],
+        )
     elif format == "summary":
+        summary = cast(_GraphSummary, result)
+        entity_types = summary.get("entity_types") or {}
+        sample_nodes = summary.get("sample_nodes") or []
+        sample_edges = summary.get("sample_edges") or []
+
         lines = [
             "## Knowledge Graph Summary",
             "",
-            f"**Total Nodes:** {result.get('total_nodes', 0)}",
-            f"**Total Edges:** {result.get('total_edges', 0)}",
+            f"**Total Nodes:** {summary.get('total_nodes', 0)}",
+            f"**Total Edges:** {summary.get('total_edges', 0)}",
             "",
             "### Entity Types",
         ]
-        for etype, count in cast(
-            dict[str, int], result.get("entity_types", {})
-        ).items():
-            lines.append(f"- {etype}: {count}")
+        lines.extend(f"- {etype}: {count}" for etype, count in entity_types.items())
 
         lines.append("\n### Sample Nodes")
-        for node in cast(list[dict[str, str]], result.get("sample_nodes", []))[:5]:
+        for node in islice(sample_nodes, 5):
             lines.append(f"- **{node['id']}** ({node['type']})")
-            if node.get("description"):
-                lines.append(f"  _{node['description'][:100]}_")
+            description = node.get("description")
+            if description:
+                lines.append(f"  _{description[:100]}_")
 
         lines.append("\n### Sample Relationships")
-        for edge in cast(list[dict[str, str]], result.get("sample_edges", []))[:5]:
+        for edge in islice(sample_edges, 5):
             lines.append(f"- {edge['source']} → {edge['target']}")
-            if edge.get("keywords"):
-                lines.append(f"  _Keywords: {edge['keywords']}_")
+            keywords = edge.get("keywords")
+            if keywords:
+                lines.append(f"  _Keywords: {keywords}_")
 
         return "\n".join(lines)
     else:
         # JSON format
-        import json
-
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        global _kg_json_cache
+        if _kg_json_cache is None or _kg_json_cache[0] is not result:
+            _kg_json_cache = (result, dumps_pretty(result))
+        return _kg_json_cache[1]
 
 
 # ============================================================================
@@ -602,20 +800,11 @@ async def plan_table_schema(
     ]
 
     # Analyze question to suggest intent
-    question_lower = question.lower()
-    if any(
-        kw in question_lower for kw in ["比較", "compare", "vs", "差異", "different"]
-    ):
-        suggested_intent = "comparison"
-        intent_reason = "問題涉及比較分析"
-    elif any(
-        kw in question_lower for kw in ["引用", "cite", "reference", "來源", "source"]
-    ):
-        suggested_intent = "citation"
-        intent_reason = "問題需要引用來源"
-    else:
-        suggested_intent = "summary"
-        intent_reason = "問題為一般性摘要"
+    suggested_intent, intent_reason = "summary", "問題為一般性摘要"
+    for intent, pattern, reason in _INTENT_RULES:
+        if pattern.search(question):
+            suggested_intent, intent_reason = intent, reason
+            break
 
     lines.extend(
         [
@@ -629,15 +818,16 @@ async def plan_table_schema(
     # Get extraction hints from documents if provided
     extraction_hints = []
     if doc_ids:
-        for doc_id in doc_ids:
-            manifest = await _document_service.get_manifest(doc_id)
+        service = _document_service()
+        manifests = await asyncio.gather(*map(service.get_manifest, doc_ids))
+        for doc_id, manifest in zip(doc_ids, manifests, strict=True):
             if manifest:
                 lines.append(f"\n### From `{doc_id}` ({manifest.title})")
 
                 # Sections as potential data sources
                 if manifest.assets.sections:
                     lines.append("**Sections:**")
-                    for sec in manifest.assets.sections[:5]:
+                    for sec in islice(manifest.assets.sections, 5):
                         lines.append(f"  - `{sec.id}`: {sec.title}")
                         extraction_hints.append(f"{sec.title} (from {doc_id})")
 
@@ -671,39 +861,7 @@ async def plan_table_schema(
         ]
     )
 
-    if suggested_intent == "comparison":
-        lines.extend(
-            [
-                "| Column | Type | Purpose |",
-                "|--------|------|---------|",
-                "| 項目/Item | text | 比較的對象 |",
-                "| 特徵1 | text | 第一個比較維度 |",
-                "| 特徵2 | text | 第二個比較維度 |",
-                "| 差異/Notes | text | 關鍵差異說明 |",
-            ]
-        )
-    elif suggested_intent == "citation":
-        lines.extend(
-            [
-                "| Column | Type | Purpose |",
-                "|--------|------|---------|",
-                "| 來源/Source | text | 引用來源 |",
-                "| 頁碼/Page | number | 頁碼 |",
-                "| 內容/Content | text | 引用內容 |",
-                "| 備註/Notes | text | 補充說明 |",
-            ]
-        )
-    else:
-        lines.extend(
-            [
-                "| Column | Type | Purpose |",
-                "|--------|------|---------|",
-                "| 主題/Topic | text | 主題項目 |",
-                "| 說明/Description | text | 詳細說明 |",
-                "| 公式/Formula | text | 相關公式（如有） |",
-                "| 備註/Notes | text | 補充說明 |",
-            ]
-        )
+    lines.append(_COLUMN_TEMPLATES[suggested_intent])
 
     lines.extend(
         [
@@ -740,26 +898,44 @@ async def get_section_content(
     Returns:
         章節內容（Markdown 格式）
     """
-    result = await _asset_service.fetch_asset(doc_id, "section", section_id)
+    result = await _asset_service().fetch_asset(doc_id, "section", section_id)
 
     if not result.success:
         return f"❌ Error: {result.error}"
 
-    # Estimate tokens
-    content = result.text_content or ""
-    est_tokens = len(content) // 4
+    return _render_section(section_id, result.page, result.text_content or "")
 
-    lines = [
-        f"## Section: {section_id}",
-        f"**Page:** {result.page or 'Unknown'}",
-        f"**Est. Tokens:** ~{est_tokens}",
-        "",
-        "---",
-        "",
-        content,
-    ]
 
-    return "\n".join(lines)
+@mcp.tool()
+async def get_sections_content(
+    doc_id: str,
+    section_ids: list[str],
+) -> str:
+    """
+    📖 批次讀取多個章節內容（get_section_content 的批次版）。
+
+    manifest 與全文只載入一次，適合連續讀取相鄰或多個章節，
+    比逐一呼叫 get_section_content 更有效率。
+
+    Args:
+        doc_id: 文件 ID
+        section_ids: 章節 ID 列表（從 manifest 獲取）
+
+    Returns:
+        各章節內容（Markdown 格式），依請求順序排列
+    """
+    if not section_ids:
+        return "❌ Error: No section IDs provided"
+
+    results = await _asset_service().fetch_sections(doc_id, section_ids)
+
+    blocks = [
+        _render_section(r.asset_id, r.page, r.text_content or "")
+        if r.success
+        else f"## Section: {r.asset_id}\n❌ Error: {r.error}"
+        for r in results
+    ]
+    return "\n\n".join(blocks)
 
 
 @mcp.tool()
@@ -890,8 +1066,7 @@ async def add_rows_to_draft(
     """
     try:
         draft = table_service.get_draft(draft_id)
-        draft.pending_rows.extend(rows)
-        table_service.update_draft(draft_id, pending_rows=draft.pending_rows)
+        table_service.add_pending_rows(draft_id, rows)
 
         return (
             f"✅ Added {len(rows)} rows to draft.\n\n"
@@ -935,30 +1110,42 @@ async def commit_draft_to_table(
 
 
 @mcp.tool()
-async def list_drafts() -> str:
+async def list_drafts(limit: int = 100, offset: int = 0) -> str:
     """
     列出所有草稿。
 
+    Args:
+        limit: 最多列出幾筆（預設 100）
+        offset: 從第幾筆開始（用於分頁）
+
     Returns:
         草稿列表
     """
-    drafts = table_service.list_drafts()
+    try:
+        drafts = table_service.list_drafts(limit=limit, offset=offset)
+    except ValueError as e:
+        return f"❌ Error: {str(e)}"
 
     if not drafts:
+        if offset and table_service.draft_count:
+            return f"No drafts at offset {offset} ({table_service.draft_count} total)."
         return "No drafts found. Use `create_table_draft` to start planning."
 
-    lines = ["# 📝 Table Drafts\n"]
-    lines.append("| ID | Title | Intent | Columns | Pending | Status |")
-    lines.append("|----|-------|--------|---------|---------|--------|")
-
-    for d in drafts:
-        status = "✅ Has Table" if d["has_table"] else "⏳ Planning"
-        lines.append(
+    header = (
+        "# 📝 Table Drafts\n\n"
+        "| ID | Title | Intent | Columns | Pending | Status |\n"
+        "|----|-------|--------|---------|---------|--------|\n"
+    )
+    return (
+        header
+        + "\n".join(
             f"| `{d['id']}` | {d['title']} | {d['intent'] or '-'} | "
-            f"{d['columns_planned']} | {d['pending_rows']} | {status} |"
+            f"{d['columns_planned']} | {d['pending_rows']} | "
+            f"{'✅ Has Table' if d['has_table'] else '⏳ Planning'} |"
+            for d in drafts
         )
-
-    return "\n".join(lines)
+        + _page_note(offset, len(drafts), table_service.draft_count, "drafts")
+    )
 
 
 @mcp.tool()
@@ -998,9 +1185,7 @@ async def resume_draft(
         if draft.proposed_columns:
             lines.append("## Proposed Columns")
             lines.append("```json")
-            lines.append(
-                json.dumps(draft.proposed_columns, indent=2, ensure_ascii=False)
-            )
+            lines.append(dumps_pretty(draft.proposed_columns))
             lines.append("```")
 
         # Extraction plan
@@ -1022,9 +1207,7 @@ async def resume_draft(
             lines.append(f"\n## Pending Rows ({len(draft.pending_rows)} total)")
             lines.append("Last 2 rows:")
             lines.append("```json")
-            lines.append(
-                json.dumps(draft.pending_rows[-2:], indent=2, ensure_ascii=False)
-            )
+            lines.append(dumps_pretty(draft.pending_rows[-2:]))
             lines.append("```")
 
         # Notes
@@ -1095,7 +1278,7 @@ async def estimate_tokens(
             lines.append(f"❌ Draft error: {e}\n")
 
     if text:
-        est_tokens = len(text) // 4
+        est_tokens = estimate_text_tokens(text)
         lines.extend(
             [
                 "## Custom Text",
@@ -1139,7 +1322,7 @@ async def create_table(
         columns=columns,
         source_description=source_description,
     )
-    preview = table_service.preview_table(table_id)
+    preview = table_service.preview_table(table_id, limit=5)
     return f"✅ Table created successfully. **table_id:** `{table_id}`\n\n{preview}"
 
 
@@ -1161,7 +1344,7 @@ async def add_rows(
     try:
         result = table_service.add_rows(table_id, rows)
         if result["success"]:
-            preview = table_service.preview_table(table_id)
+            preview = table_service.preview_table(table_id, limit=5)
             msg = f"✅ Added {result['added']} rows. Total: {result['total_rows']}.\n\n{preview}"
             if result.get("errors"):
                 msg += f"\n⚠️ Warning: {len(result['errors'])} rows had validation errors and were skipped."
@@ -1192,7 +1375,7 @@ async def update_row(
     try:
         result = table_service.update_row(table_id, index, row)
         if result["success"]:
-            preview = table_service.preview_table(table_id)
+            preview = table_service.preview_table(table_id, limit=5)
             return f"✅ Row {index} updated successfully.\n\n{preview}"
         else:
             return f"❌ Failed to update row. Errors: {result.get('errors')}"
@@ -1217,7 +1400,7 @@ async def delete_row(
     """
     try:
         result = table_service.delete_row(table_id, index)
-        preview = table_service.preview_table(table_id)
+        preview = table_service.preview_table(table_id, limit=5)
         return (
             f"✅ Row {index} deleted. Total rows: {result['total_rows']}.\n\n{preview}"
         )
@@ -1245,26 +1428,39 @@ async def delete_table(
 
 
 @mcp.tool()
-async def list_tables() -> str:
+async def list_tables(limit: int = 100, offset: int = 0) -> str:
     """
     列出所有目前正在處理或已儲存的表格。
 
+    Args:
+        limit: 最多列出幾筆（預設 100）
+        offset: 從第幾筆開始（用於分頁）
+
     Returns:
         表格列表 (Markdown 格式)
     """
-    tables = table_service.list_tables()
+    try:
+        tables = table_service.list_tables(limit=limit, offset=offset)
+    except ValueError as e:
+        return f"❌ Error: {str(e)}"
     if not tables:
+        if offset and table_service.table_count:
+            return f"No tables at offset {offset} ({table_service.table_count} total)."
         return "No tables found. Use `create_table` to start a new one."
 
-    lines = ["# 📊 Available Tables\n"]
-    lines.append("| ID | Title | Intent | Rows | Created |")
-    lines.append("|----|-------|--------|------|---------|")
-    for t in tables:
-        lines.append(
+    header = (
+        "# 📊 Available Tables\n\n"
+        "| ID | Title | Intent | Rows | Created |\n"
+        "|----|-------|--------|------|---------|\n"
+    )
+    return (
+        header
+        + "\n".join(
             f"| `{t['id']}` | {t['title']} | {t['intent']} | {t['rows']} | {t['created_at']} |"
+            for t in tables
         )
-
-    return "\n".join(lines)
+        + _page_note(offset, len(tables), table_service.table_count, "tables")
+    )
 
 
 @mcp.tool()
@@ -1330,9 +1526,7 @@ async def resume_table(table_id: str) -> str:
         if status["last_rows"]:
             lines.append("## Last Rows (for context)")
             lines.append("```json")
-            import json
-
-            lines.append(json.dumps(status["last_rows"], indent=2, ensure_ascii=False))
+            lines.append(dumps_pretty(status["last_rows"]))
             lines.append("```")
 
         lines.extend(
@@ -1414,15 +1608,51 @@ async def render_table(
 @mcp.resource("documents://list")
 async def resource_document_list() -> str:
     """Dynamic resource listing all processed documents."""
-    result: str = await list_documents()
-    return result
+    global _doc_list_cache
+    version = _document_service().version
+    if _doc_list_cache is None or _doc_list_cache[0] != version:
+        _doc_list_cache = (version, await list_documents())
+    return _doc_list_cache[1]
 
 
 @mcp.resource("document://{doc_id}/manifest")
 async def resource_document_manifest(doc_id: str) -> str:
     """Dynamic resource for document manifest."""
-    result: str = await inspect_document_manifest(doc_id)
-    return result
+    return await _cached_doc_resource(doc_id, "manifest", inspect_document_manifest)
+
+
+async def _cached_doc_resource(
+    doc_id: str, view: str, render: Callable[[str], Awaitable[str]]
+) -> str:
+    """
+    Return a rendered per-document resource.
+
+    Renderings are kept in memory until the next ingest and on disk next to
+    the manifest (cleared when it is saved), so restarts skip rendering too.
+    Stored renderings are keyed by _RENDER_VERSION.
+    """
+    global _doc_resource_version
+    service = _document_service()
+    version = service.version
+    if version != _doc_resource_version:
+        _doc_resource_cache.clear()
+        _doc_resource_version = version
+
+    cached = _doc_resource_cache.get((doc_id, view))
+    if cached is not None:
+        return cached
+
+    stored_view = f"{view}.v{_RENDER_VERSION}"
+    text = await service.load_rendered(doc_id, stored_view)
+    if text is None:
+        if await service.get_manifest(doc_id) is None:
+            # Unknown ids and unreadable manifests are answered, never cached
+            return await render(doc_id)
+        text = await render(doc_id)
+        service.save_rendered(doc_id, stored_view, text, version)
+    if service.version == version:
+        _doc_resource_cache[doc_id, view] = text
+    return text
 
 
 @mcp.resource("document://{doc_id}/figures")
@@ -1433,39 +1663,36 @@ async def resource_document_figures(doc_id: str) -> str:
     Returns a concise outline of figures with IDs, pages, and sizes.
     Use fetch_document_asset to retrieve actual image content.
     """
-    manifest = await _document_service.get_manifest(doc_id)
+    return await _cached_doc_resource(doc_id, "figures", _render_document_figures)
+
+
+async def _render_document_figures(doc_id: str) -> str:
+    manifest = await _document_service().get_manifest(doc_id)
     if manifest is None:
         return f"Document not found: {doc_id}"
 
-    lines = [
-        f"# Figures in {manifest.title or doc_id}",
-        "",
-        f"**Total Figures:** {len(manifest.assets.figures)}",
-        "",
-        "| ID | Page | Size | Caption |",
-        "|-----|------|------|---------|",
+    figures = manifest.assets.figures
+    rows = [
+        f"| `{fig.id}` | {fig.page or '-'} | {fig.width}×{fig.height} "
+        f"| {_trunc(fig.caption, 40)} |"
+        for fig in figures
     ]
 
-    for fig in manifest.assets.figures:
-        caption = (
-            (fig.caption[:40] + "...")
-            if fig.caption and len(fig.caption) > 40
-            else (fig.caption or "-")
-        )
-        lines.append(
-            f"| `{fig.id}` | {fig.page or '-'} | {fig.width}×{fig.height} | {caption} |"
-        )
-
-    lines.extend(
+    return "\n".join(
         [
+            f"# Figures in {manifest.title or doc_id}",
+            "",
+            f"**Total Figures:** {len(figures)}",
+            "",
+            "| ID | Page | Size | Caption |",
+            "|-----|------|------|---------|",
+            *rows,
             "",
             "---",
             "_Use `fetch_document_asset(doc_id, 'figure', '<id>')` to retrieve image content._",
         ]
     )
 
-    return "\n".join(lines)
-
 
 @mcp.resource("document://{doc_id}/tables")
 async def resource_document_tables(doc_id: str) -> str:
@@ -1475,37 +1702,35 @@ async def resource_document_tables(doc_id: str) -> str:
     Returns a concise outline of tables with IDs and descriptions.
     Use fetch_document_asset to retrieve table content as markdown.
     """
-    manifest = await _document_service.get_manifest(doc_id)
+    return await _cached_doc_resource(doc_id, "tables", _render_document_tables)
+
+
+async def _render_document_tables(doc_id: str) -> str:
+    manifest = await _document_service().get_manifest(doc_id)
     if manifest is None:
         return f"Document not found: {doc_id}"
 
-    lines = [
-        f"# Tables in {manifest.title or doc_id}",
-        "",
-        f"**Total Tables:** {len(manifest.assets.tables)}",
-        "",
-        "| ID | Page | Description |",
-        "|-----|------|-------------|",
+    tables = manifest.assets.tables
+    rows = [
+        f"| `{tab.id}` | {tab.page or '-'} | {_trunc(tab.caption, 50)} |"
+        for tab in tables
     ]
 
-    for tab in manifest.assets.tables:
-        desc = (
-            (tab.caption[:50] + "...")
-            if tab.caption and len(tab.caption) > 50
-            else (tab.caption or "-")
-        )
-        lines.append(f"| `{tab.id}` | {tab.page or '-'} | {desc} |")
-
-    lines.extend(
+    return "\n".join(
         [
+            f"# Tables in {manifest.title or doc_id}",
+            "",
+            f"**Total Tables:** {len(tables)}",
+            "",
+            "| ID | Page | Description |",
+            "|-----|------|-------------|",
+            *rows,
             "",
             "---",
             "_Use `fetch_document_asset(doc_id, 'table', '<id>')` to retrieve table content._",
         ]
     )
 
-    return "\n".join(lines)
-
 
 @mcp.resource("document://{doc_id}/sections")
 async def resource_document_sections(doc_id: str) -> str:
@@ -1515,32 +1740,34 @@ async def resource_document_sections(doc_id: str) -> str:
     Returns a hierarchical outline of document sections.
     Use fetch_document_asset to retrieve section text content.
     """
-    manifest = await _document_service.get_manifest(doc_id)
+    return await _cached_doc_resource(doc_id, "sections", _render_document_sections)
+
+
+async def _render_document_sections(doc_id: str) -> str:
+    manifest = await _document_service().get_manifest(doc_id)
     if manifest is None:
         return f"Document not found: {doc_id}"
 
-    lines = [
-        f"# Sections in {manifest.title or doc_id}",
-        "",
-        f"**Total Sections:** {len(manifest.assets.sections)}",
-        "",
+    sections = manifest.assets.sections
+    rows = [
+        f"{_INDENTS[min(max(sec.level - 1, 0), 7)]}- **{sec.title}** `{sec.id}` "
+        + (f"(L{sec.start_line}-{sec.end_line})" if sec.start_line else "")
+        for sec in sections
     ]
 
-    for sec in manifest.assets.sections:
-        indent = "  " * (sec.level - 1) if sec.level > 1 else ""
-        line_info = f"(L{sec.start_line}-{sec.end_line})" if sec.start_line else ""
-        lines.append(f"{indent}- **{sec.title}** `{sec.id}` {line_info}")
-
-    lines.extend(
+    return "\n".join(
         [
+            f"# Sections in {manifest.title or doc_id}",
+            "",
+            f"**Total Sections:** {len(sections)}",
+            "",
+            *rows,
             "",
             "---",
             "_Use `fetch_document_asset(doc_id, 'section', '<id>')` to retrieve section text._",
         ]
     )
 
-    return "\n".join(lines)
-
 
 @mcp.resource("document://{doc_id}/outline")
 async def resource_document_outline(doc_id: str) -> str:
@@ -1556,77 +1783,98 @@ async def resource_document_outline(doc_id: str) -> str:
 
     This is the recommended starting point for exploring a document.
     """
-    manifest = await _document_service.get_manifest(doc_id)
+    return await _cached_doc_resource(doc_id, "outline", _render_document_outline)
+
+
+async def _render_document_outline(doc_id: str, limit: int | None = None) -> str:
+    manifest = await _document_service().get_manifest(doc_id)
     if manifest is None:
         return f"Document not found: {doc_id}"
 
-    lines = [
-        f"# 📄 {manifest.title or 'Untitled Document'}",
-        "",
-        "## Metadata",
-        f"- **ID:** `{doc_id}`",
-        f"- **Pages:** {manifest.page_count}",
-        f"- **Source:** {manifest.filename or 'Unknown'}",
-        "",
-    ]
+    assets = manifest.assets
+    sections, figures, tables = assets.sections, assets.figures, assets.tables
+    entities = manifest.lightrag_entities
+
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        f"# 📄 {manifest.title or 'Untitled Document'}\n"
+        "\n"
+        "## Metadata\n"
+        f"- **ID:** `{doc_id}`\n"
+        f"- **Pages:** {manifest.page_count}\n"
+        f"- **Source:** {manifest.filename or 'Unknown'}\n"
+        "\n"
+    )
 
     # Sections outline
-    lines.append("## 📑 Sections")
-    if manifest.assets.sections:
-        for sec in manifest.assets.sections:
-            indent = "  " * (sec.level - 1) if sec.level > 1 else ""
-            lines.append(f"{indent}- {sec.title}")
+    w("## 📑 Sections\n")
+    if sections:
+        shown = sections if limit is None else sections[:limit]
+        w(
+            "".join(
+                f"{_INDENTS[min(max(sec.level - 1, 0), 7)]}- {sec.title}\n"
+                for sec in shown
+            )
+        )
+        if len(sections) > len(shown):
+            w(f"- _...and {len(sections) - len(shown)} more_\n")
     else:
-        lines.append("_No sections detected_")
-    lines.append("")
+        w("_No sections detected_\n")
+    w("\n")
 
     # Figures summary
-    lines.append(f"## 🖼️ Figures ({len(manifest.assets.figures)})")
-    if manifest.assets.figures:
-        for fig in manifest.assets.figures[:5]:
-            caption = f": {fig.caption[:30]}..." if fig.caption else ""
-            lines.append(f"- `{fig.id}` (P.{fig.page or '?'}){caption}")
-        if len(manifest.assets.figures) > 5:
-            lines.append(f"- _...and {len(manifest.assets.figures) - 5} more_")
+    w(f"## 🖼️ Figures ({len(figures)})\n")
+    if figures:
+        w(
+            "".join(
+                f"- `{fig.id}` (P.{fig.page or '?'})"
+                f"{f': {_trunc(fig.caption, 30)}' if fig.caption else ''}\n"
+                for fig in islice(figures, 5)
+            )
+        )
+        if len(figures) > 5:
+            w(f"- _...and {len(figures) - 5} more_\n")
     else:
-        lines.append("_No figures detected_")
-    lines.append("")
+        w("_No figures detected_\n")
+    w("\n")
 
     # Tables summary
-    lines.append(f"## 📊 Tables ({len(manifest.assets.tables)})")
-    if manifest.assets.tables:
-        for tab in manifest.assets.tables[:5]:
-            desc = f": {tab.caption[:30]}..." if tab.caption else ""
-            lines.append(f"- `{tab.id}` (P.{tab.page or '?'}){desc}")
-        if len(manifest.assets.tables) > 5:
-            lines.append(f"- _...and {len(manifest.assets.tables) - 5} more_")
+    w(f"## 📊 Tables ({len(tables)})\n")
+    if tables:
+        w(
+            "".join(
+                f"- `{tab.id}` (P.{tab.page or '?'})"
+                f"{f': {_trunc(tab.caption, 30)}' if tab.caption else ''}\n"
+                for tab in islice(tables, 5)
+            )
+        )
+        if len(tables) > 5:
+            w(f"- _...and {len(tables) - 5} more_\n")
     else:
-        lines.append("_No tables detected_")
-    lines.append("")
+        w("_No tables detected_\n")
+    w("\n")
 
     # Knowledge graph entities
-    if manifest.lightrag_entities:
-        lines.append(
-            f"## 🔗 Knowledge Graph Entities ({len(manifest.lightrag_entities)})"
-        )
-        lines.append(", ".join(manifest.lightrag_entities[:15]))
-        if len(manifest.lightrag_entities) > 15:
-            lines.append(f"_...and {len(manifest.lightrag_entities) - 15} more_")
-    lines.append("")
+    if entities:
+        w(f"## 🔗 Knowledge Graph Entities ({len(entities)})\n")
+        w(manifest.entity_preview(15))
+        w("\n")
+        if len(entities) > 15:
+            w(f"_...and {len(entities) - 15} more_\n")
+    w("\n")
 
     # Quick actions
-    lines.extend(
-        [
-            "---",
-            "## Quick Actions",
-            f"- View figures: `document://{doc_id}/figures`",
-            f"- View tables: `document://{doc_id}/tables`",
-            f"- View sections: `document://{doc_id}/sections`",
-            f"- Fetch asset: `fetch_document_asset('{doc_id}', '<type>', '<id>')`",
-        ]
+    w(
+        "---\n"
+        "## Quick Actions\n"
+        f"- View figures: `document://{doc_id}/figures`\n"
+        f"- View tables: `document://{doc_id}/tables`\n"
+        f"- View sections: `document://{doc_id}/sections`\n"
+        f"- Fetch asset: `fetch_document_asset('{doc_id}', '<type>', '<id>')`"
     )
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 @mcp.resource("knowledge-graph://summary")
@@ -1639,29 +1887,30 @@ async def resource_knowledge_graph_summary() -> str:
     - Entity type distribution
     - Sample entities and relationships
     """
-    if _knowledge_graph is None:
+    if _knowledge_graph() is None:
         return "LightRAG is not enabled. Set ENABLE_LIGHTRAG=true in .env"
 
-    result = await _knowledge_graph.export_graph(format="summary", limit=30)
+    result = await _synced_knowledge_service().export_graph(format="summary", limit=30)
 
     if "error" in result:
         return f"Error: {result['error']}"
 
+    summary = cast(_GraphSummary, result)
+    entity_types = summary.get("entity_types") or {}
+    sample_nodes = summary.get("sample_nodes") or []
+
     lines = [
         "# 🔗 Knowledge Graph Summary",
         "",
-        f"**Total Nodes:** {result.get('total_nodes', 0)}",
-        f"**Total Edges:** {result.get('total_edges', 0)}",
+        f"**Total Nodes:** {summary.get('total_nodes', 0)}",
+        f"**Total Edges:** {summary.get('total_edges', 0)}",
         "",
         "## Entity Types",
     ]
-
-    for etype, count in cast(dict[str, int], result.get("entity_types", {})).items():
-        lines.append(f"- **{etype}:** {count}")
+    lines.extend(f"- **{etype}:** {count}" for etype, count in entity_types.items())
 
     lines.append("\n## Sample Entities")
-    for node in cast(list[dict[str, str]], result.get("sample_nodes", []))[:8]:
-        lines.append(f"- {node['id']} ({node['type']})")  # type: ignore
+    lines.extend(f"- {node['id']} ({node['type']})" for node in islice(sample_nodes, 8))
 
     lines.extend(
         [
@@ -1696,11 +1945,11 @@ async def resource_table_content(table_id: str) -> str:
     enabling token-efficient table resumption workflows.
     """
     try:
-        # Read from saved MD file directly
+        # Read from saved MD file directly, off the event loop
         md_path = settings.table_output_dir / f"{table_id}.md"
-        if md_path.exists():
-            return md_path.read_text(encoding="utf-8")
-        else:
+        try:
+            return await asyncio.to_thread(md_path.read_text, encoding="utf-8")
+        except FileNotFoundError:
             # Fallback to preview
             return table_service.preview_table(table_id, limit=100)
     except ValueError:
@@ -1720,8 +1969,7 @@ async def resource_table_status(table_id: str) -> str:
     This is the most token-efficient way to resume table work.
     """
     try:
-        status = table_service.get_table_status(table_id)
-        return json.dumps(status, indent=2, ensure_ascii=False)
+        return table_service.get_table_status_json(table_id)
     except ValueError:
         return f"Table not found: {table_id}"
 
@@ -1742,7 +1990,7 @@ async def resource_draft_content(draft_id: str) -> str:
     """
     try:
         draft = table_service.get_draft(draft_id)
-        return json.dumps(
+        return dumps_pretty(
             {
                 "table_id": draft.table_id,
                 "intent": draft.intent,
@@ -1754,9 +2002,7 @@ async def resource_draft_content(draft_id: str) -> str:
                 "pending_rows": draft.pending_rows,
                 "notes": draft.notes,
                 "est_tokens": draft.estimate_tokens(),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except ValueError:
         return f"Draft not found: {draft_id}"
@@ -1767,11 +2013,30 @@ async def resource_draft_content(draft_id: str) -> str:
 # ============================================================================
 
 
+def _run_stdio() -> None:
+    """Serve over stdio, on a uvloop event loop when uvloop is installed."""
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        mcp.run()
+        return
+
+    anyio.run(
+        mcp.run_stdio_async,
+        backend_options={"loop_factory": uvloop.new_event_loop},
+    )
+
+
 def main() -> None:
     """Run the MCP server."""
 
     # Run with stdio transport
-    mcp.run()
+    try:
+        _run_stdio()
+    finally:
+        table_service.flush_drafts()
+        if _job_store.cache_info().currsize:
+            _job_store().close()
 
 
 if __name__ == "__main__":
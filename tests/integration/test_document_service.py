@@ -6,6 +6,8 @@ Tests the complete document ingestion flow.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from pathlib import Path
 
 import pytest
@@ -66,6 +68,31 @@ class TestDocumentServiceIntegration:
 
         assert manifest is None
 
+    @pytest.mark.asyncio
+    async def test_concurrent_get_manifest_shares_one_load(
+        self, service: DocumentService
+    ):
+        """Test concurrent callers for one doc_id share a single load."""
+        calls: list[str] = []
+
+        def load_manifest(doc_id: str) -> None:
+            calls.append(doc_id)
+            time.sleep(0.05)
+            return None
+
+        service.repository.load_manifest = load_manifest  # type: ignore[method-assign]
+
+        results = await asyncio.gather(
+            *(service.get_manifest("doc_a") for _ in range(5)),
+            service.get_manifest("doc_b"),
+        )
+
+        assert results == [None] * 6
+        assert sorted(calls) == ["doc_a", "doc_b"]
+
+        await service.get_manifest("doc_a")
+        assert calls.count("doc_a") == 2
+
 
 class TestPDFExtractorIntegration:
     """Integration tests for PDF extractor (requires actual PDF)."""
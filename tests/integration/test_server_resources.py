@@ -0,0 +1,208 @@
+"""
+Integration Tests for MCP Server Resources
+
+Tests rendered per-document resources and their caches against real
+ingestion.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from src.application.asset_service import AssetService
+from src.application.document_service import DocumentService
+from src.infrastructure.file_storage import FileStorage
+from src.infrastructure.pdf_extractor import PyMuPDFExtractor
+from src.presentation import server
+
+
+def write_pdf(path: Path, titles: list[str]) -> Path:
+    """Write a PDF with one titled page per entry."""
+    doc = fitz.open()
+    for title in titles:
+        page = doc.new_page()
+        page.insert_text((72, 72), title, fontsize=20)
+        page.insert_text((72, 110), f"Body text for {title}.", fontsize=11)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def service(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> DocumentService:
+    """Point the server at services backed by a temporary data directory."""
+    repository = FileStorage(base_dir=temp_dir / "data")
+    document_service = DocumentService(
+        repository=repository,
+        pdf_extractor=PyMuPDFExtractor(),
+        knowledge_graph=None,
+    )
+    asset_service = AssetService(repository=repository)
+    monkeypatch.setattr(server, "_document_service", lambda: document_service)
+    monkeypatch.setattr(server, "_asset_service", lambda: asset_service)
+    monkeypatch.setattr(server, "_doc_resource_cache", {})
+    monkeypatch.setattr(server, "_doc_resource_version", 0)
+    return document_service
+
+
+async def ingest(service: DocumentService, pdf: Path) -> str:
+    (result,) = await service.ingest([str(pdf)])
+    assert result.success, result.error
+    return result.doc_id
+
+
+class TestDocumentResourceCache:
+    """Tests for the cached per-document resources."""
+
+    async def test_reingest_refreshes_resource(
+        self, service: DocumentService, temp_dir: Path
+    ):
+        """Test a re-ingested document is never served from a stale cache."""
+        pdf = write_pdf(temp_dir / "study.pdf", ["Intro", "Methods"])
+        doc_id = await ingest(service, pdf)
+
+        first = await server.resource_document_manifest(doc_id)
+        assert "**pages:** 2" in first
+        assert await server.resource_document_manifest(doc_id) == first
+
+        write_pdf(pdf, ["Intro", "Methods", "Results"])
+        assert await ingest(service, pdf) == doc_id
+
+        second = await server.resource_document_manifest(doc_id)
+        assert "**pages:** 3" in second
+
+        # After a restart the stored rendering is the fresh one
+        server._doc_resource_cache.clear()
+        assert await server.resource_document_manifest(doc_id) == second
+
+    async def test_unknown_documents_are_not_cached(self, service: DocumentService):
+        """Test resources for unknown ids do not grow the cache."""
+        for i in range(20):
+            text = await server.resource_document_outline(f"doc_missing_{i}")
+            assert "not found" in text
+
+        assert server._doc_resource_cache == {}
+
+    async def test_ingest_clears_cached_entries(
+        self, service: DocumentService, temp_dir: Path
+    ):
+        """Test entries from before an ingest are dropped, not kept alongside."""
+        doc_a = await ingest(service, write_pdf(temp_dir / "a.pdf", ["A"]))
+        doc_b = await ingest(service, write_pdf(temp_dir / "b.pdf", ["B"]))
+        await server.resource_document_outline(doc_a)
+        await server.resource_document_figures(doc_b)
+        assert len(server._doc_resource_cache) == 2
+
+        await ingest(service, write_pdf(temp_dir / "c.pdf", ["C"]))
+        await server.resource_document_outline(doc_a)
+
+        assert list(server._doc_resource_cache) == [(doc_a, "outline")]
+
+    async def test_render_racing_an_ingest_is_not_kept(
+        self, service: DocumentService, temp_dir: Path
+    ):
+        """Test a rendering that overlaps an ingest is neither cached nor stored."""
+        doc_id = await ingest(service, write_pdf(temp_dir / "a.pdf", ["A"]))
+
+        async def render(doc_id: str) -> str:
+            service.version += 1  # an ingest finishes mid-render
+            return "stale"
+
+        assert await server._cached_doc_resource(doc_id, "test", render) == "stale"
+        assert server._doc_resource_cache == {}
+        stored_view = f"test.v{server._RENDER_VERSION}"
+        assert await service.load_rendered(doc_id, stored_view) is None
+
+
+class TestGetSectionsContent:
+    """Tests for the batched get_sections_content tool."""
+
+    @pytest.fixture
+    async def doc_id(self, service: DocumentService, temp_dir: Path) -> str:
+        pdf = write_pdf(temp_dir / "study.pdf", ["Intro", "Methods", "Results"])
+        return await ingest(service, pdf)
+
+    @staticmethod
+    def blocks(text: str) -> list[str]:
+        return text.split("\n\n## Section: ")
+
+    async def test_returns_sections_in_request_order(self, doc_id: str):
+        text = await server.get_sections_content(
+            doc_id, ["sec_results", "sec_intro", "sec_methods"]
+        )
+
+        blocks = self.blocks(text)
+        assert len(blocks) == 3
+        for block, title in zip(blocks, ["Results", "Intro", "Methods"], strict=True):
+            assert f"Body text for {title}." in block
+        assert blocks[0].startswith("## Section: sec_results")
+        assert blocks[2].startswith("sec_methods")
+
+    async def test_matches_single_section_tool(self, doc_id: str):
+        text = await server.get_sections_content(doc_id, ["sec_methods"])
+
+        assert text == await server.get_section_content(doc_id, "sec_methods")
+
+    async def test_unknown_ids_fail_in_place(self, doc_id: str):
+        text = await server.get_sections_content(
+            doc_id, ["sec_intro", "sec_missing", "sec_results"]
+        )
+
+        blocks = self.blocks(text)
+        assert "Body text for Intro." in blocks[0]
+        assert blocks[1] == "sec_missing\n❌ Error: Section not found: sec_missing"
+        assert "Body text for Results." in blocks[2]
+
+    async def test_duplicate_ids_are_each_returned(self, doc_id: str):
+        text = await server.get_sections_content(
+            doc_id, ["sec_intro", "sec_intro", "sec_methods", "sec_intro"]
+        )
+
+        blocks = self.blocks(text)
+        assert len(blocks) == 4
+        assert blocks[1] == blocks[3]
+        assert "Body text for Intro." in blocks[1]
+        assert "Body text for Methods." in blocks[2]
+
+    async def test_unknown_document_and_empty_request(self, service: DocumentService):
+        text = await server.get_sections_content("doc_missing_abc", ["sec_a", "sec_b"])
+        assert text.count("❌ Error: Document not found: doc_missing_abc") == 2
+
+        assert await server.get_sections_content("doc_missing_abc", []) == (
+            "❌ Error: No section IDs provided"
+        )
+
+
+class TestPreviewDocumentOutline:
+    """Tests for the preview_document_outline tool."""
+
+    @pytest.fixture
+    async def doc_id(self, service: DocumentService, temp_dir: Path) -> str:
+        titles = ["Intro", "Methods", "Results", "Discussion"]
+        return await ingest(service, write_pdf(temp_dir / "study.pdf", titles))
+
+    async def test_limit_truncates_sections(self, doc_id: str):
+        text = await server.preview_document_outline(doc_id, limit=2)
+
+        assert "- Intro\n- Methods\n- _...and 2 more_\n" in text
+        assert "- Results" not in text
+
+    async def test_limit_covering_all_sections_matches_resource(self, doc_id: str):
+        text = await server.preview_document_outline(doc_id, limit=10)
+
+        assert "more_" not in text
+        assert text == await server.resource_document_outline(doc_id)
+
+    async def test_zero_limit_lists_no_sections(self, doc_id: str):
+        text = await server.preview_document_outline(doc_id, limit=0)
+
+        assert "## 📑 Sections\n- _...and 4 more_\n" in text
+        assert "- Intro" not in text
+
+    async def test_negative_limit_is_rejected(self, doc_id: str):
+        text = await server.preview_document_outline(doc_id, limit=-1)
+
+        assert text == "❌ Error: limit must be >= 0"
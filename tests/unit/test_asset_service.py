@@ -0,0 +1,95 @@
+"""
+Unit Tests for Application Layer - Asset Service
+
+Tests figure fetching: original-size pass-through and processed figures.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from src.application.asset_service import AssetService
+from src.domain.entities import DocumentAssets, DocumentManifest, FigureAsset
+from src.infrastructure.file_storage import FileStorage
+
+DOC_ID = "doc_test_abc123"
+
+
+def write_image(path: Path, fmt: str, size: tuple[int, int] = (40, 20)) -> bytes:
+    """Write a solid image and return its bytes."""
+    Image.new("RGB", size, "red").save(path, fmt)
+    return path.read_bytes()
+
+
+@pytest.fixture
+def storage(temp_dir: Path) -> FileStorage:
+    return FileStorage(base_dir=temp_dir)
+
+
+def save_figure(storage: FileStorage, path: Path, ext: str) -> AssetService:
+    """Save a manifest holding one figure and return a service over it."""
+    storage.save_manifest(
+        DocumentManifest(
+            doc_id=DOC_ID,
+            filename="test.pdf",
+            assets=DocumentAssets(
+                figures=[FigureAsset(id="fig_1_1", page=1, path=str(path), ext=ext)]
+            ),
+        )
+    )
+    return AssetService(repository=storage)
+
+
+@pytest.mark.parametrize(
+    ("ext", "fmt", "media_type"),
+    [("png", "PNG", "image/png"), ("jpg", "JPEG", "image/jpeg")],
+)
+async def test_original_size_passes_web_formats_through(
+    storage: FileStorage, temp_dir: Path, ext: str, fmt: str, media_type: str
+):
+    path = temp_dir / f"fig.{ext}"
+    original = write_image(path, fmt)
+    service = save_figure(storage, path, ext)
+
+    result = await service.fetch_asset(DOC_ID, "figure", "fig_1_1", max_size=0)
+
+    assert result.success
+    assert result.image_media_type == media_type
+    assert base64.b64decode(result.image_base64) == original
+
+
+async def test_original_size_reencodes_other_formats(
+    storage: FileStorage, temp_dir: Path
+):
+    path = temp_dir / "fig.tiff"
+    original = write_image(path, "TIFF")
+    service = save_figure(storage, path, "tiff")
+
+    result = await service.fetch_asset(DOC_ID, "figure", "fig_1_1", max_size=0)
+
+    assert result.success
+    assert result.image_media_type == "image/jpeg"
+    data = base64.b64decode(result.image_base64)
+    assert data != original
+    assert Image.open(io.BytesIO(data)).format == "JPEG"
+
+
+async def test_rewritten_image_is_processed_again(storage: FileStorage, temp_dir: Path):
+    path = temp_dir / "fig.png"
+    write_image(path, "PNG", (40, 20))
+    service = save_figure(storage, path, "png")
+
+    first = await service.fetch_asset(DOC_ID, "figure", "fig_1_1")
+    write_image(path, "PNG", (60, 30))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = await service.fetch_asset(DOC_ID, "figure", "fig_1_1")
+
+    assert (first.width, second.width) == (40, 60)
+    assert second.image_media_type == "image/jpeg"
@@ -2,6 +2,8 @@
 Unit tests for chunking strategies.
 """
 
+import pytest
+
 from src.domain.chunking import (
     BasicChunker,
     Chunk,
@@ -26,35 +28,23 @@ class TestChunkConfig:
         assert config.min_chunk_size == 100
         assert config.respect_sentences is True
 
-    def test_for_document_type_general(self) -> None:
-        """Test config for general documents."""
-        config = ChunkConfig.for_document_type(DocumentType.GENERAL)
-        assert config.chunk_size == 1000
-        assert config.chunk_overlap == 200
-
-    def test_for_document_type_technical(self) -> None:
-        """Test config for technical documents."""
-        config = ChunkConfig.for_document_type(DocumentType.TECHNICAL)
-        assert config.chunk_size == 1500
-        assert config.chunk_overlap == 300
-
-    def test_for_document_type_simple(self) -> None:
-        """Test config for simple documents."""
-        config = ChunkConfig.for_document_type(DocumentType.SIMPLE)
-        assert config.chunk_size == 800
-        assert config.chunk_overlap == 160
-
-    def test_for_document_type_legal(self) -> None:
-        """Test config for legal documents."""
-        config = ChunkConfig.for_document_type(DocumentType.LEGAL)
-        assert config.chunk_size == 1200
-        assert config.chunk_overlap == 400
-
-    def test_for_document_type_medical(self) -> None:
-        """Test config for medical documents."""
-        config = ChunkConfig.for_document_type(DocumentType.MEDICAL)
-        assert config.chunk_size == 1000
-        assert config.chunk_overlap == 250
+    @pytest.mark.parametrize(
+        ("doc_type", "chunk_size", "chunk_overlap"),
+        [
+            (DocumentType.GENERAL, 1000, 200),
+            (DocumentType.TECHNICAL, 1500, 300),
+            (DocumentType.SIMPLE, 800, 160),
+            (DocumentType.LEGAL, 1200, 400),
+            (DocumentType.MEDICAL, 1000, 250),
+        ],
+    )
+    def test_for_document_type(
+        self, doc_type: DocumentType, chunk_size: int, chunk_overlap: int
+    ) -> None:
+        """Test config for each document type."""
+        config = ChunkConfig.for_document_type(doc_type)
+        assert config.chunk_size == chunk_size
+        assert config.chunk_overlap == chunk_overlap
 
 
 class TestChunk:
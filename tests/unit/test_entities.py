@@ -197,6 +197,39 @@ class TestDocumentAssets:
         assert section is not None
         assert section.id == "sec_methods"
 
+    def test_find_section_sees_appended_sections(self, assets: DocumentAssets):
+        """Test lookups pick up sections added after the first lookup."""
+        assert assets.find_section("sec_results") is None
+
+        assets.sections.append(
+            SectionAsset(
+                id="sec_results",
+                title="Introduction",
+                level=1,
+                page=3,
+                start_line=51,
+                end_line=80,
+                preview="",
+            )
+        )
+
+        assert assets.find_section("sec_results") is not None
+        # Duplicate titles resolve to the first section, as before
+        assert assets.find_section("introduction").id == "sec_intro"
+
+    def test_find_sees_elements_replaced_in_place(self, assets: DocumentAssets):
+        """Test lookups pick up an element replaced without a length change."""
+        assert assets.find_section("sec_intro") is not None
+
+        replacement = assets.sections[0].model_copy(
+            update={"id": "sec_background", "title": "Background"}
+        )
+        assets.sections[0] = replacement
+
+        assert assets.find_section("sec_background") is replacement
+        assert assets.find_section("background") is replacement
+        assert assets.find_section("sec_intro") is None
+
     def test_get_summary(self, assets: DocumentAssets):
         """Test getting asset counts."""
         summary = assets.get_summary()
@@ -224,6 +257,16 @@ class TestDocumentManifest:
         assert summary["tables"] == 1
         assert summary["sections"] == 2
 
+    def test_entity_preview(self, sample_manifest_dict):
+        """Test entity preview is truncated, memoized and not serialized."""
+        sample_manifest_dict["lightrag_entities"] = ["A", "B", "C"]
+        manifest = DocumentManifest.model_validate(sample_manifest_dict)
+
+        assert manifest.entity_preview(2) == "A, B"
+        assert manifest.entity_preview(2) is manifest.entity_preview(2)
+        assert manifest.entity_preview(15) == "A, B, C"
+        assert "_entity_previews" not in manifest.model_dump()
+
 
 class TestIngestResult:
     """Tests for IngestResult."""
@@ -6,6 +6,7 @@ Tests for FileStorage repository implementation.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -56,12 +57,68 @@ class TestFileStorage:
         assert loaded.title == "Test Document"
         assert loaded.page_count == 5
 
+    def test_load_manifest_is_cached_until_file_changes(
+        self, storage: FileStorage, sample_manifest: DocumentManifest
+    ):
+        """Test repeated loads reuse the parsed manifest until it is rewritten."""
+        storage.save_manifest(sample_manifest)
+        storage.invalidate_manifest()
+
+        first = storage.load_manifest("doc_test_abc123")
+        assert storage.load_manifest("doc_test_abc123") is first
+
+        # Rewrite the file behind the cache's back with a newer mtime
+        manifest_path = Path(sample_manifest.manifest_path)
+        data = sample_manifest.model_copy(update={"title": "Revised"})
+        manifest_path.write_text(data.model_dump_json(), encoding="utf-8")
+        stat = manifest_path.stat()
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = storage.load_manifest("doc_test_abc123")
+        assert reloaded is not None
+        assert reloaded is not first
+        assert reloaded.title == "Revised"
+
     def test_load_nonexistent_manifest(self, storage: FileStorage):
         """Test loading non-existent manifest returns None."""
         loaded = storage.load_manifest("doc_nonexistent")
 
         assert loaded is None
 
+    def test_rendered_views_are_cleared_on_manifest_save(
+        self, storage: FileStorage, sample_manifest: DocumentManifest
+    ):
+        """Test stored renderings exist only for known documents and go stale."""
+        storage.save_rendered("doc_unknown", "outline", "# Nope")
+        assert storage.load_rendered("doc_unknown", "outline") is None
+
+        storage.save_manifest(sample_manifest)
+        storage.save_rendered("doc_test_abc123", "outline", "# Outline")
+        assert storage.load_rendered("doc_test_abc123", "outline") == "# Outline"
+
+        storage.save_manifest(sample_manifest)
+        assert storage.load_rendered("doc_test_abc123", "outline") is None
+
+    def test_concurrent_rendered_saves_do_not_collide(
+        self, storage: FileStorage, sample_manifest: DocumentManifest
+    ):
+        """Test parallel saves of one view each use their own temp file."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        storage.save_manifest(sample_manifest)
+        texts = [f"# Outline {i}" for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(
+                pool.map(
+                    lambda t: storage.save_rendered("doc_test_abc123", "outline", t),
+                    texts,
+                )
+            )
+
+        assert storage.load_rendered("doc_test_abc123", "outline") in texts
+        rendered_dir = storage.base_dir / "doc_test_abc123" / "rendered"
+        assert [p.name for p in rendered_dir.iterdir()] == ["outline.md"]
+
     def test_save_and_load_markdown(self, storage: FileStorage):
         """Test saving and loading markdown content."""
         content = "# Test Document\n\nThis is test content."
@@ -172,6 +229,46 @@ class TestFileStorage:
         assert documents[0].doc_id == "doc_test_abc123"
         assert documents[0].title == "Test Document"
 
+    def test_list_documents_uses_index(
+        self, temp_dir: Path, sample_manifest: DocumentManifest
+    ):
+        """Test listing is served from the persisted documents index."""
+        FileStorage(base_dir=temp_dir).save_manifest(sample_manifest)
+
+        assert (temp_dir / FileStorage.INDEX_NAME).exists()
+
+        # A fresh instance lists from the index without reading manifests
+        storage = FileStorage(base_dir=temp_dir)
+        Path(sample_manifest.manifest_path).write_text("not json")
+        documents = storage.list_documents()
+
+        assert [d.doc_id for d in documents] == ["doc_test_abc123"]
+        assert documents[0].page_count == 5
+
+    def test_list_documents_drops_removed_documents(
+        self, temp_dir: Path, sample_manifest: DocumentManifest
+    ):
+        """Test documents removed outside save_manifest leave the index."""
+        storage = FileStorage(base_dir=temp_dir)
+        storage.save_manifest(sample_manifest)
+        Path(sample_manifest.manifest_path).unlink()
+
+        assert storage.list_documents() == []
+        assert FileStorage(base_dir=temp_dir).list_documents() == []
+        assert "doc_test_abc123" not in storage.index_path.read_text()
+
+    def test_list_documents_rebuilds_missing_index(
+        self, storage: FileStorage, sample_manifest: DocumentManifest
+    ):
+        """Test data written before the index existed is still listed."""
+        storage.save_manifest(sample_manifest)
+        storage.index_path.unlink()
+
+        documents = FileStorage(base_dir=storage.base_dir).list_documents()
+
+        assert [d.doc_id for d in documents] == ["doc_test_abc123"]
+        assert storage.index_path.exists()
+
     def test_document_exists(
         self, storage: FileStorage, sample_manifest: DocumentManifest
     ):
@@ -0,0 +1,199 @@
+"""
+Unit Tests for Infrastructure Layer - Job Store
+
+Tests for FileJobStore journal persistence and replay.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.job import Job, JobStatus, JobType
+from src.infrastructure.job_store import FileJobStore
+
+
+def make_job(job_id: str) -> Job:
+    """Create a minimal ingest job."""
+    return Job(job_id=job_id, job_type=JobType.INGEST_PDF, input_files=["a.pdf"])
+
+
+class TestFileJobStore:
+    """Tests for FileJobStore."""
+
+    @pytest.fixture
+    def store(self, temp_dir: Path) -> FileJobStore:
+        """Create FileJobStore with temporary directory."""
+        return FileJobStore(temp_dir)
+
+    async def test_create_and_get(self, store: FileJobStore):
+        """Test jobs are served from memory after create."""
+        job = make_job("job_1")
+        await store.create(job)
+
+        assert await store.get("job_1") == job
+        assert await store.get("missing") is None
+
+    async def test_returned_jobs_are_copies(self, store: FileJobStore):
+        """Test mutating a job passed in or handed out leaves the store alone."""
+        job = make_job("job_1")
+        await store.create(job)
+        job.start()
+
+        fetched = await store.get("job_1")
+        assert fetched is not None
+        assert fetched.status == JobStatus.PENDING
+        fetched.fail("boom")
+
+        stored = await store.get("job_1")
+        assert stored is not None
+        assert stored.status == JobStatus.PENDING
+        assert [s.job_id for s in await store.list_active()] == ["job_1"]
+
+    async def test_create_duplicate_raises(self, store: FileJobStore):
+        """Test duplicate job IDs are rejected."""
+        await store.create(make_job("job_1"))
+
+        with pytest.raises(ValueError):
+            await store.create(make_job("job_1"))
+
+    async def test_updates_append_to_journal(self, store: FileJobStore):
+        """Test each mutation appends exactly one NDJSON line."""
+        job = make_job("job_1")
+        await store.create(job)
+        job.start()
+        await store.update(job)
+        await store.delete("job_1")
+        await store.flush()
+
+        lines = store.log_path.read_text(encoding="utf-8").splitlines()
+        ops = [json.loads(line)["op"] for line in lines]
+        assert ops == ["put", "put", "del"]
+        assert list(store.jobs_dir.glob("*.json")) == []
+
+    async def test_replay_restores_state(self, temp_dir: Path):
+        """Test a new store instance replays the journal."""
+        store = FileJobStore(temp_dir)
+        job = make_job("job_1")
+        await store.create(job)
+        job.complete({"doc_id": "doc_x"})
+        await store.update(job)
+        await store.create(make_job("job_2"))
+        await store.delete("job_2")
+        await store.flush()
+
+        reopened = FileJobStore(temp_dir)
+        restored = await reopened.get("job_1")
+
+        assert restored is not None
+        assert restored.status == JobStatus.COMPLETED
+        assert restored.result == {"doc_id": "doc_x"}
+        assert await reopened.get("job_2") is None
+
+    async def test_replay_skips_torn_line(self, temp_dir: Path):
+        """Test a partially written final record is ignored."""
+        store = FileJobStore(temp_dir)
+        await store.create(make_job("job_1"))
+        await store.flush()
+        with open(store.log_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "job": {"job_')
+
+        reopened = FileJobStore(temp_dir)
+
+        assert await reopened.get("job_1") is not None
+        assert len(await reopened.list_all()) == 1
+
+        # A record appended after the torn line must survive the next restart
+        await reopened.create(make_job("job_2"))
+        await reopened.flush()
+        assert await FileJobStore(temp_dir).get("job_2") is not None
+
+    async def test_migrates_legacy_json_files(self, temp_dir: Path):
+        """Test per-job JSON files from older versions are imported."""
+        jobs_dir = temp_dir / "jobs"
+        jobs_dir.mkdir()
+        legacy = make_job("job_old")
+        (jobs_dir / "job_old.json").write_text(
+            legacy.model_dump_json(), encoding="utf-8"
+        )
+
+        store = FileJobStore(temp_dir)
+
+        assert await store.get("job_old") is not None
+        assert not (jobs_dir / "job_old.json").exists()
+        assert await FileJobStore(temp_dir).get("job_old") is not None
+
+    async def test_unreadable_legacy_files_are_kept(self, temp_dir: Path):
+        """Test legacy files that fail to parse are set aside, not deleted."""
+        jobs_dir = temp_dir / "jobs"
+        jobs_dir.mkdir()
+        (jobs_dir / "job_old.json").write_text(
+            make_job("job_old").model_dump_json(), encoding="utf-8"
+        )
+        (jobs_dir / "job_bad.json").write_text("{not json", encoding="utf-8")
+
+        store = FileJobStore(temp_dir)
+
+        assert await store.get("job_old") is not None
+        assert not (jobs_dir / "job_old.json").exists()
+        assert (jobs_dir / "job_bad.json.bad").read_text() == "{not json"
+
+    async def test_compact_keeps_one_record_per_job(self, store: FileJobStore):
+        """Test compaction drops superseded records."""
+        job = make_job("job_1")
+        await store.create(job)
+        for step in range(5):
+            job.update_progress(step=step)
+            await store.update(job)
+
+        store.close()
+
+        lines = store.log_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+
+    async def test_append_compacts_past_threshold(self, store: FileJobStore):
+        """Test a long-running store compacts without waiting for a restart."""
+        store.COMPACT_THRESHOLD = 3
+        job = make_job("job_1")
+        await store.create(job)
+        for step in range(10):
+            job.update_progress(step=step)
+            await store.update(job)
+        await store.flush()
+
+        lines = store.log_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) <= store.COMPACT_THRESHOLD + 1
+
+    async def test_list_active_and_all(self, store: FileJobStore):
+        """Test listing filters terminal jobs for list_active."""
+        done = make_job("job_done")
+        await store.create(done)
+        done.complete()
+        await store.update(done)
+        await store.create(make_job("job_pending"))
+
+        active = await store.list_active()
+        assert [s.job_id for s in active] == ["job_pending"]
+        assert len(await store.list_all()) == 2
+
+    async def test_active_index_survives_replay(self, temp_dir: Path):
+        """Test the active index tracks transitions and is rebuilt on replay."""
+        store = FileJobStore(temp_dir)
+        running = make_job("job_running")
+        await store.create(running)
+        running.start()
+        await store.update(running)
+        failed = make_job("job_failed")
+        await store.create(failed)
+        failed.fail("boom")
+        await store.update(failed)
+        await store.create(make_job("job_deleted"))
+        await store.delete("job_deleted")
+
+        assert [s.job_id for s in await store.list_active()] == ["job_running"]
+        await store.flush()
+
+        replayed = FileJobStore(temp_dir)
+        assert [s.job_id for s in await replayed.list_active()] == ["job_running"]
@@ -0,0 +1,111 @@
+"""
+Unit tests for KnowledgeService.
+"""
+
+import pytest
+
+from src.application.knowledge_service import KnowledgeService
+from src.domain.repositories import KnowledgeGraphInterface
+
+
+class FakeKnowledgeGraph(KnowledgeGraphInterface):
+    """Counts queries and returns a canned answer."""
+
+    def __init__(self, answer: str = "answer") -> None:
+        self.answer = answer
+        self.calls = 0
+        self.exports = 0
+
+    @property
+    def is_available(self) -> bool:
+        return True
+
+    async def insert(self, doc_id: str, text: str) -> None:
+        pass
+
+    async def query(self, query: str, mode: str = "hybrid") -> str:
+        self.calls += 1
+        return self.answer
+
+    async def extract_entities(self, text: str, limit: int = 5) -> list[str]:
+        return []
+
+    async def export_graph(
+        self,
+        format: str = "summary",
+        limit: int = 50,
+        entity_types: list[str] | None = None,
+    ) -> dict[str, object]:
+        self.exports += 1
+        return {"format": format, "total_nodes": limit}
+
+
+@pytest.fixture
+def graph():
+    return FakeKnowledgeGraph()
+
+
+async def test_repeat_query_is_cached(graph):
+    service = KnowledgeService(knowledge_graph=graph)
+
+    assert await service.query("q", mode="local") == "answer"
+    assert await service.query("q", mode="local") == "answer"
+    assert graph.calls == 1
+
+    await service.query("q", mode="global")
+    assert graph.calls == 2
+
+
+async def test_query_key_ignores_spacing_but_not_case(graph):
+    service = KnowledgeService(knowledge_graph=graph)
+
+    await service.query("What is  Propofol?")
+    await service.query("  What is Propofol? ")
+    assert graph.calls == 1
+
+    await service.query("Treatment of ALL")
+    await service.query("Treatment of all")
+    assert graph.calls == 3
+
+
+async def test_invalidate_cache(graph):
+    service = KnowledgeService(knowledge_graph=graph)
+
+    await service.query("q")
+    service.invalidate_cache()
+    await service.query("q")
+
+    assert graph.calls == 2
+
+
+async def test_expired_entry_is_refetched(graph, monkeypatch):
+    service = KnowledgeService(knowledge_graph=graph)
+    monkeypatch.setattr(KnowledgeService, "CACHE_TTL_SECONDS", 0.0)
+
+    await service.query("q")
+    await service.query("q")
+
+    assert graph.calls == 2
+
+
+async def test_empty_result_not_cached():
+    graph = FakeKnowledgeGraph(answer="")
+    service = KnowledgeService(knowledge_graph=graph)
+
+    assert await service.query("q") == "No results found."
+    await service.query("q")
+
+    assert graph.calls == 2
+
+
+async def test_export_graph_is_cached_per_format_and_limit(graph):
+    service = KnowledgeService(knowledge_graph=graph)
+
+    first = await service.export_graph("summary", limit=30)
+    assert await service.export_graph("summary", limit=30) is first
+    assert graph.exports == 1
+
+    await service.export_graph("summary", limit=10)
+    service.invalidate_cache()
+    await service.export_graph("summary", limit=30)
+    assert graph.exports == 3
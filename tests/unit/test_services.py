@@ -127,6 +127,26 @@ class TestAssetExtractor:
         assert "Introduction" in content
         assert "important information" in content
 
+    def test_extract_sections_content(
+        self, extractor: AssetExtractor, sample_markdown: str
+    ):
+        """Test batch extraction matches per-section extraction."""
+        from src.domain.entities import SectionAsset
+
+        sections = [
+            SectionAsset(
+                id=f"sec_{start}", title="", level=2, start_line=start, end_line=end
+            )
+            for start, end in [(4, 8), (0, 2), (10_000, 10_001)]
+        ]
+
+        contents = extractor.extract_sections_content(sample_markdown, sections)
+
+        assert contents == [
+            extractor.extract_section_content(sample_markdown, s) for s in sections
+        ]
+        assert contents[2] == ""
+
     def test_extract_table_by_id(self, extractor: AssetExtractor, sample_markdown: str):
         """Test extracting table by ID."""
         table_content = extractor.extract_table_by_id(sample_markdown, "tab_1")
@@ -126,3 +126,176 @@ async def test_render_table_excel(table_service, tmp_path):
     assert result["success"] is True
     assert "test_output" in result["file_path"]
     assert result["file_path"].endswith(".xlsx")
+
+
+def test_estimate_table_tokens_counts_cjk(table_service):
+    columns = [{"name": "藥物", "type": "text"}]
+    table_id = table_service.create_table(
+        intent="summary", title="CJK", columns=columns
+    )
+    table_service.add_rows(table_id, [{"藥物": "阿斯匹靈"}])
+
+    est = table_service.estimate_table_tokens(table_id)
+
+    # CJK characters count roughly one token each, not a quarter
+    assert est["content_tokens"] >= 6
+    assert est["full_preview_tokens"] == est["preview_tokens"]
+
+
+def test_draft_pending_tokens_are_incremental(table_service):
+    draft_id = table_service.create_draft(title="Draft")
+    draft = table_service.get_draft(draft_id)
+
+    draft.pending_rows.extend([{"Drug": "Aspirin"}] * 3)
+    first = draft.pending_tokens()
+    draft.pending_rows.extend([{"Drug": "Aspirin"}] * 3)
+    assert draft.pending_tokens() == 2 * first
+
+    table_service.update_draft(draft_id, pending_rows=[{"Drug": "Aspirin"}] * 3)
+    assert draft.pending_tokens() == first
+
+
+async def test_draft_updates_are_coalesced(table_service, monkeypatch):
+    draft_id = table_service.create_draft(title="Draft")
+    writes = []
+    monkeypatch.setattr(
+        table_service, "_save_draft", lambda d_id, draft: writes.append(d_id)
+    )
+
+    for i in range(5):
+        table_service.update_draft(draft_id, notes=f"note {i}")
+    assert writes == []
+
+    assert table_service.flush_drafts() == 1
+    assert writes == [draft_id]
+
+
+def test_pending_rows_are_appended_and_reloaded(table_service):
+    draft_id = table_service.create_draft(title="Draft")
+    table_service.add_pending_rows(draft_id, [{"a": 1}, {"a": 2}])
+    assert table_service.add_pending_rows(draft_id, [{"a": 3}]) == 3
+    table_service.flush_drafts()
+
+    pending_file = table_service.draft_dir / f"{draft_id}.pending.jsonl"
+    assert len(pending_file.read_text().splitlines()) == 3
+    meta = (table_service.draft_dir / f"{draft_id}.json").read_text()
+    assert "pending_rows" not in meta
+
+    reloaded = TableService()
+    assert reloaded.get_draft(draft_id).pending_rows == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+    assert reloaded.delete_draft(draft_id)
+    assert not pending_file.exists()
+
+
+def test_table_rows_are_appended_and_legacy_rows_migrated(table_service, tmp_path):
+    table_id = table_service.create_table(
+        "summary", "T", [{"name": "A", "type": "text"}]
+    )
+    table_service.add_rows(table_id, [{"A": "x"}])
+    table_service.add_rows(table_id, [{"A": "y"}])
+
+    rows_file = tmp_path / f"{table_id}.rows.jsonl"
+    assert len(rows_file.read_text().splitlines()) == 2
+    assert '"rows"' not in (tmp_path / f"{table_id}.json").read_text()
+
+    # A table saved before rows moved out keeps them inline
+    rows_file.unlink()
+    meta_path = tmp_path / f"{table_id}.json"
+    meta_path.write_text(meta_path.read_text()[:-2] + ',\n  "rows": [{"A": "z"}]\n}')
+
+    reloaded = TableService()
+    assert reloaded.get_table_context(table_id).rows == [{"A": "z"}]
+    assert rows_file.exists()
+    assert reloaded.delete_table(table_id)
+    assert not rows_file.exists()
+
+
+def test_rows_appended_after_torn_line_survive_restarts(table_service, tmp_path):
+    table_id = table_service.create_table(
+        "summary", "T", [{"name": "A", "type": "text"}]
+    )
+    table_service.add_rows(table_id, [{"A": "r1"}])
+    draft_id = table_service.create_draft(title="Draft")
+    table_service.add_pending_rows(draft_id, [{"a": 1}])
+    table_service.flush_drafts()
+
+    # Simulate crashes mid-append
+    rows_file = tmp_path / f"{table_id}.rows.jsonl"
+    pending_file = table_service.draft_dir / f"{draft_id}.pending.jsonl"
+    for path in (rows_file, pending_file):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"A": "r')
+
+    restarted = TableService()
+    restarted.add_rows(table_id, [{"A": "r2"}])
+    restarted.add_pending_rows(draft_id, [{"a": 2}])
+
+    reloaded = TableService()
+    assert reloaded.get_table_context(table_id).rows == [{"A": "r1"}, {"A": "r2"}]
+    assert reloaded.get_draft(draft_id).pending_rows == [{"a": 1}, {"a": 2}]
+
+
+def test_list_tables_paging(table_service):
+    ids = [
+        table_service.create_table(
+            intent="summary", title=f"T{i}", columns=[{"name": "A", "type": "text"}]
+        )
+        for i in range(5)
+    ]
+
+    page = table_service.list_tables(limit=2, offset=1)
+
+    assert [t["id"] for t in page] == ids[1:3]
+    assert len(table_service.list_tables()) == table_service.table_count == 5
+    for bad in ({"limit": -1}, {"offset": -1}):
+        with pytest.raises(ValueError, match=">= 0"):
+            table_service.list_tables(**bad)
+        with pytest.raises(ValueError, match=">= 0"):
+            table_service.list_drafts(**bad)
+
+
+def test_table_status_json_is_reused_until_table_changes(table_service):
+    columns = [{"name": "Drug", "type": "text"}]
+    table_id = table_service.create_table(intent="summary", title="T", columns=columns)
+
+    first = table_service.get_table_status_json(table_id)
+    assert table_service.get_table_status_json(table_id) is first
+
+    table_service.add_rows(table_id, [{"Drug": "Aspirin"}])
+    updated = table_service.get_table_status_json(table_id)
+    assert updated is not first
+    assert '"row_count": 1' in updated
+
+
+def test_preview_reuses_rendered_rows(table_service):
+    columns = [{"name": "Drug", "type": "text"}]
+    table_id = table_service.create_table(intent="summary", title="T", columns=columns)
+    table_service.add_rows(table_id, [{"Drug": f"D{i}"} for i in range(3)])
+    assert "| D2 |" in table_service.preview_table(table_id)
+
+    table_service.add_rows(table_id, [{"Drug": "D3"}])
+    table_service.update_cell(table_id, 0, "Drug", "X")
+    table_service.delete_row(table_id, 1)
+
+    preview = table_service.preview_table(table_id, limit=2)
+    assert "| X |\n| D2 |" in preview
+    assert "D1" not in preview
+    assert "*(Showing 2 of 3 rows)*" in preview
+
+
+def test_add_rows_reports_errors_per_row(table_service):
+    columns = [
+        {"name": "Drug", "type": "text"},
+        {"name": "Dose", "type": "number"},
+    ]
+    table_id = table_service.create_table(intent="summary", title="T", columns=columns)
+
+    result = table_service.add_rows(
+        table_id,
+        [{"Drug": "A", "Dose": 1}, {"Drug": "B", "Dose": "high"}, {"Dose": 2}],
+    )
+
+    assert result["added"] == 1
+    assert [e["row_index"] for e in result["errors"]] == [1, 2]
+    assert result["errors"][1]["errors"] == ["Missing required column: 'Drug'"]
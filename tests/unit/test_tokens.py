@@ -0,0 +1,20 @@
+"""
+Unit tests for token estimation.
+"""
+
+import pytest
+
+from src.domain.tokens import estimate_text_tokens
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", 0),
+        ("abcdefgh", 2),
+        ("麻醉藥物", 4),
+        ("propofol 麻醉", 2 + 2),
+    ],
+)
+def test_estimate_text_tokens(text, expected):
+    assert estimate_text_tokens(text) == expected